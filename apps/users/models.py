@@ -10,6 +10,7 @@ import logging
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinLengthValidator, RegexValidator
 from django.core.exceptions import ValidationError
@@ -341,6 +342,13 @@ class User(AbstractBaseUser, PermissionsMixin):
         """
         return self.rol == role
 
+    @cached_property
+    def is_distribuidor(self):
+        """
+        Indica si el usuario tiene rol 'distribuidor'; se calcula una vez por instancia (por request).
+        """
+        return self.rol == ROLE_DISTRIBUIDOR
+
     def is_admin(self):
         """
         Verifica si el usuario es administrador.
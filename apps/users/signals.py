@@ -198,4 +198,20 @@ def asignar_codigo_id(sender, instance, created, **kwargs):
 
     except Exception as e:
         logger.exception(f"Error al generar código ID para {instance.username} (rol: {instance.rol}): {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+
+@receiver(post_save, sender=User)
+def sincronizar_usuario_wallet(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Mantiene la copia de username y rol guardada en la billetera del usuario (Wallet.user_username,
+    Wallet.user_rol), usada por los listados del admin para no unir la tabla de usuarios.
+    Las billeteras nuevas la toman en Wallet.save(); aquí solo se propagan cambios posteriores.
+    """
+    if created:
+        return
+    if update_fields is not None and not {'username', 'rol'} & set(update_fields):
+        return
+    Wallet.objects.filter(user=instance).exclude(
+        user_username=instance.username, user_rol=instance.rol
+    ).update(user_username=instance.username, user_rol=instance.rol)
@@ -127,7 +127,7 @@ class DistribuidorVendedorAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request):
         """Optimiza consultas con select_related."""
-        return super().get_queryset(request).select_related('distribuidor', 'vendedor', 'creado_por')
+        return super().get_queryset(request).con_usuarios().select_related('creado_por')
 
     def get_readonly_fields(self, request, obj=None):
         """Restringe edición de campos sensibles para no superusuarios."""
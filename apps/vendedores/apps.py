@@ -6,3 +6,6 @@ class VendedoresConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.vendedores'
     verbose_name = _("Gestión de Vendedores")
+
+    def ready(self):
+        import apps.vendedores.signals  # noqa: F401
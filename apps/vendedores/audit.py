@@ -0,0 +1,69 @@
+"""
+Escritura diferida de los registros de auditoría de vendedores.
+Los registros se acumulan durante la transacción y se insertan en un solo
+bulk_create cuando ésta se confirma.
+"""
+import weakref
+from contextvars import ContextVar
+
+from django.db import transaction
+
+BATCH_SIZE = 500
+
+# Lotes en curso por (alias, savepoints abiertos). Cada lote solo lo referencia con fuerza su
+# callback de on_commit; si el savepoint que lo registró se revierte, Django descarta el callback
+# y el lote desaparece del diccionario con sus registros.
+_lotes = ContextVar('vendedores_audit_lotes', default=None)
+
+
+class _Lote(list):
+    """
+    Registros pendientes de un nivel (transacción o savepoint) del bloque atómico en curso.
+    """
+
+    def __init__(self, using):
+        super().__init__()
+        self.using = using
+
+    def flush(self):
+        if self:
+            type(self[0]).objects.using(self.using).bulk_create(self, batch_size=BATCH_SIZE)
+            self.clear()
+
+
+def _clave(connection):
+    # Los bloques atómicos sin savepoint (None) comparten el destino del nivel que los contiene
+    return connection.alias, tuple(sid for sid in connection.savepoint_ids if sid)
+
+
+def queue(log, using=None):
+    """
+    Encola un registro de auditoría sin guardar para insertarlo al confirmar la transacción.
+    Fuera de un bloque atómico se inserta de inmediato. Los registros encolados dentro de un
+    savepoint que se revierte se descartan con él.
+    """
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        type(log).objects.using(connection.alias).bulk_create([log])
+        return
+
+    lotes = _lotes.get()
+    if lotes is None:
+        lotes = weakref.WeakValueDictionary()
+        _lotes.set(lotes)
+
+    alias, sids = clave = _clave(connection)
+    lote = lotes.get(clave)
+    if lote is None:
+        lote = _Lote(alias)
+        lotes[clave] = lote
+        transaction.on_commit(lote.flush, using=alias)
+
+    # Los lotes vivos de savepoints más internos ya cerrados se confirmaron (RELEASE): pasan a este
+    # nivel, que comparte con ellos las reversiones que aún pueden ocurrir.
+    for (otro_alias, otros_sids), hijo in list(lotes.items()):
+        if otro_alias == alias and len(otros_sids) > len(sids) and otros_sids[:len(sids)] == sids:
+            lote.extend(hijo)
+            hijo.clear()
+            del lotes[(otro_alias, otros_sids)]
+    lote.append(log)
@@ -0,0 +1,15 @@
+"""
+Excepciones de negocio para el módulo de vendedores en MexaRed.
+"""
+
+
+class RelacionVendedorError(ValueError):
+    """
+    Error en una operación sobre DistribuidorVendedor (saldo, activación).
+    Hereda de ValueError para que las vistas y servicios existentes lo sigan capturando;
+    `code` identifica el caso y el mensaje se traduce solo al convertirlo a texto.
+    """
+    def __init__(self, mensaje, code=None):
+        self.mensaje = mensaje
+        self.code = code
+        super().__init__(mensaje)
@@ -0,0 +1,58 @@
+"""
+Campos de modelo personalizados para el módulo de vendedores.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+
+from django import forms
+from django.core import exceptions
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+CENTAVO = Decimal('0.01')
+
+
+class CentsField(models.BigIntegerField):
+    """
+    Monto monetario almacenado como BIGINT en centavos y expuesto en Python como Decimal
+    con dos decimales. La aritmética y los índices en la base de datos operan sobre enteros.
+    """
+    description = _("Monto en centavos")
+
+    @staticmethod
+    def to_cents(value):
+        """
+        Convierte un monto en unidades (Decimal, int, float o str) a centavos enteros.
+        """
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return int(value.quantize(CENTAVO, rounding=ROUND_HALF_UP).scaleb(2))
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return Decimal(value).scaleb(-2).quantize(CENTAVO)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, Decimal):
+            return value
+        try:
+            return Decimal(str(value)).quantize(CENTAVO, rounding=ROUND_HALF_UP)
+        except ArithmeticError:
+            raise exceptions.ValidationError(
+                self.error_messages['invalid'],
+                code='invalid',
+                params={'value': value},
+            )
+
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        if value is None:
+            return None
+        return self.to_cents(self.to_python(value))
+
+    def formfield(self, **kwargs):
+        return models.Field.formfield(self, **{
+            'form_class': forms.DecimalField,
+            'decimal_places': 2,
+            **kwargs,
+        })
@@ -6,14 +6,180 @@ con validaciones avanzadas, internacionalización, soporte multi-moneda, y escal
 from django import forms
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
-from django.core.validators import MinValueValidator, RegexValidator
+from django.core.validators import RegexValidator
 from django.contrib.auth.forms import UserCreationForm
-from django.db import transaction
+from django.db import IntegrityError
+from django.db.models.functions import Lower
 from decimal import Decimal
 import re
-from apps.users.models import User
 from apps.users.forms import normalize_email, normalize_username
+# User y DistribuidorVendedor se requieren al definir las clases (Meta.model), por lo que no pueden diferirse.
+from apps.users.models import User
 from apps.vendedores.models import DistribuidorVendedor
+from apps.vendedores.services import create_vendedores
+
+# ============================
+# 🔸 Constantes globales
+# ============================
+
+MONTO_MINIMO = Decimal('0.01')
+
+INPUT_CLASS = 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500'
+
+# Atributos HTML de los widgets (compartidos por todas las instancias de los formularios)
+FIRST_NAME_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. Juan"),
+    'aria-describedby': 'first_name_help',
+    'autocomplete': 'given-name',
+}
+LAST_NAME_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. Pérez"),
+    'aria-describedby': 'last_name_help',
+    'autocomplete': 'family-name',
+}
+DIRECCION_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. Calle Falsa 123, CDMX"),
+    'aria-describedby': 'direccion_help',
+    'autocomplete': 'address-line1',
+}
+TELEFONO_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. +521234567890"),
+    'aria-describedby': 'telefono_help',
+    'autocomplete': 'tel',
+}
+EMAIL_CONTACTO_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. contacto@correo.com"),
+    'aria-describedby': 'email_contacto_help',
+    'autocomplete': 'email',
+}
+NOMBRE_COMERCIAL_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. Juan's Telecom"),
+    'aria-describedby': 'nombre_comercial_help',
+    'autocomplete': 'organization',
+}
+RFC_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. XAXX010101000"),
+    'aria-describedby': 'rfc_help',
+    'autocomplete': 'off',
+}
+USERNAME_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. juanperez"),
+    'aria-describedby': 'username_help',
+    'autocomplete': 'username',
+}
+EMAIL_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. juan.perez@correo.com"),
+    'aria-describedby': 'email_help',
+    'autocomplete': 'email',
+}
+PASSWORD1_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Contraseña"),
+    'aria-describedby': 'password1_help',
+    'autocomplete': 'new-password',
+}
+PASSWORD2_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Confirmar contraseña"),
+    'aria-describedby': 'password2_help',
+    'autocomplete': 'new-password',
+}
+MONTO_ASIGNAR_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. 500.00"),
+    'step': '0.01',
+    'aria-describedby': 'monto_help',
+    'autocomplete': 'off',
+}
+MONTO_DESCONTAR_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. 100.00"),
+    'step': '0.01',
+    'aria-describedby': 'monto_help',
+    'autocomplete': 'off',
+}
+TELEFONO_CONTACTO_ATTRS = {
+    'class': INPUT_CLASS,
+    'placeholder': _("Ej. +521234567890"),
+    'aria-describedby': 'telefono_contacto_help',
+    'autocomplete': 'tel',
+}
+
+# Expresiones regulares compiladas una sola vez
+USERNAME_RE = re.compile(r'[\w.@+-]{3,150}')  # Formato y longitud en una sola pasada (fullmatch)
+# RegexValidator usa search(), por lo que estos patrones conservan sus anclas
+RFC_RE = re.compile(r'^([A-ZÑ&]{3,4})\d{6}[A-Z0-9]{3}$')
+PHONE_RE = re.compile(r'^\+?1?\d{10,15}$')
+
+# Mensajes de error (proxies lazy construidos una sola vez al importar el módulo)
+ERROR_USERNAME_LENGTH = _("El nombre de usuario debe tener entre 3 y 150 caracteres.")
+ERROR_USERNAME_FORMAT = _("El nombre de usuario solo puede contener letras, números y @/./+/-/_")
+ERROR_USERNAME_TAKEN = _("El nombre de usuario ya está en uso.")
+ERROR_EMAIL_REQUIRED = _("El correo electrónico es obligatorio.")
+ERROR_EMAIL_TAKEN = _("Ya existe una cuenta con este correo electrónico.")
+ERROR_EMAIL_CONTACTO_TAKEN = _("El correo de contacto ya está registrado.")
+ERROR_EMAIL_DUPLICADO = _("El correo principal y el correo de contacto no pueden ser iguales.")
+ERROR_RFC_INVALID = _("Debe ser un RFC válido (ejemplo: XAXX010101000).")
+ERROR_RFC_TAKEN = _("Ya existe una cuenta con este RFC.")
+ERROR_PHONE_INVALID = _("El número de teléfono debe ser válido (10-15 dígitos, opcionalmente con +).")
+ERROR_MISSING_DISTRIBUIDOR = _("Se requiere un distribuidor para crear la relación.")
+ERROR_USUARIO_NO_CREADO = _("No se pudo crear el usuario vendedor. Intenta de nuevo.")
+ERROR_MONTO_INVALID = _("El monto debe ser mayor a cero.")
+ERROR_MONTO_EXCEDE_SALDO = _("El monto excede el saldo disponible del vendedor.")
+ERROR_DISTRIBUIDOR_INVALID = _("No tienes permiso para modificar esta relación.")
+
+# Validadores compartidos por los campos de los formularios
+PHONE_VALIDATOR = RegexValidator(regex=PHONE_RE, message=ERROR_PHONE_INVALID, code='invalid_phone')
+RFC_VALIDATOR = RegexValidator(regex=RFC_RE, message=ERROR_RFC_INVALID, code='invalid_rfc')
+
+# Restricciones UNIQUE de users_user por campo del formulario, por prefijo del nombre de la
+# restricción (PostgreSQL: users_user_email_key, users_user_username_<hash>_uniq) o de la
+# columna que reporta SQLite (users_user.email). rfc no tiene UNIQUE en la base de datos.
+CAMPOS_UNICOS = (
+    ('username', ('users_user_username_', 'users_user.username'), ERROR_USERNAME_TAKEN),
+    ('email', ('users_user_email_', 'users_user.email', 'unique_email_case_insensitive'), ERROR_EMAIL_TAKEN),
+)
+
+def _restriccion_violada(exc):
+    """
+    Nombre de la restricción violada según el driver: diag.constraint_name en psycopg; SQLite no
+    lo expone y se toma la columna o índice de "UNIQUE constraint failed: ...".
+    """
+    diag = getattr(exc.__cause__, 'diag', None)
+    if diag is not None and diag.constraint_name:
+        return diag.constraint_name
+    _antes, encontrado, detalle = str(exc).partition('UNIQUE constraint failed: ')
+    if not encontrado:
+        return ''
+    return detalle.split(',')[0].strip().removeprefix('index ').strip("'")
+
+def error_unicidad(exc):
+    """
+    Traduce un IntegrityError al alta de un usuario en un ValidationError sobre el campo cuya
+    restricción UNIQUE se violó; si no se reconoce la restricción, el error queda sin campo.
+    """
+    restriccion = _restriccion_violada(exc)
+    for campo, prefijos, error in CAMPOS_UNICOS:
+        if restriccion and restriccion.startswith(prefijos):
+            return ValidationError({campo: error})
+    return ValidationError(ERROR_USUARIO_NO_CREADO, code='save_error')
+
+def email_registrado(email):
+    """
+    Indica si un correo (ya normalizado a minúsculas) pertenece a una cuenta existente.
+    Filtra por LOWER(email) para resolverse con el índice único unique_email_case_insensitive
+    en lugar del UPPER(...) que genera email__iexact.
+    """
+    return User.objects.alias(email_lower=Lower('email')).filter(email_lower=email).exists()
 
 class CrearVendedorForm(UserCreationForm):
     """
@@ -25,94 +191,53 @@ class CrearVendedorForm(UserCreationForm):
         max_length=50,
         required=False,
         label=_("Nombre(s)"),
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ej. Juan"),
-            'aria-describedby': 'first_name_help',
-            'autocomplete': 'given-name'
-        }),
+        widget=forms.TextInput(attrs=FIRST_NAME_ATTRS),
         help_text=_("Nombre del vendedor (opcional).")
     )
     last_name = forms.CharField(
         max_length=50,
         required=False,
         label=_("Apellido(s)"),
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ej. Pérez"),
-            'aria-describedby': 'last_name_help',
-            'autocomplete': 'family-name'
-        }),
+        widget=forms.TextInput(attrs=LAST_NAME_ATTRS),
         help_text=_("Apellidos del vendedor (opcional).")
     )
     direccion = forms.CharField(
         max_length=255,
         required=False,
         label=_("Dirección de Contacto"),
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ej. Calle Falsa 123, CDMX"),
-            'aria-describedby': 'direccion_help',
-            'autocomplete': 'address-line1'
-        }),
+        widget=forms.TextInput(attrs=DIRECCION_ATTRS),
         help_text=_("Dirección física o de contacto del vendedor (opcional).")
     )
     telefono = forms.CharField(
         max_length=20,
         required=False,
         label=_("Teléfono de Contacto"),
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ej. +521234567890"),
-            'aria-describedby': 'telefono_help',
-            'autocomplete': 'tel'
-        }),
+        widget=forms.TextInput(attrs=TELEFONO_ATTRS),
         validators=[
-            RegexValidator(
-                regex=r'^\+?1?\d{10,15}$',
-                message=_("El número de teléfono debe ser válido (10-15 dígitos, opcionalmente con +).")
-            )
+            PHONE_VALIDATOR
         ],
         help_text=_("Teléfono en formato internacional (opcional).")
     )
     email_contacto = forms.EmailField(
         required=False,
         label=_("Correo de Contacto"),
-        widget=forms.EmailInput(attrs={
-            'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ej. contacto@correo.com"),
-            'aria-describedby': 'email_contacto_help',
-            'autocomplete': 'email'
-        }),
+        widget=forms.EmailInput(attrs=EMAIL_CONTACTO_ATTRS),
         help_text=_("Correo adicional para contacto (opcional).")
     )
     nombre_comercial = forms.CharField(
         max_length=100,
         required=False,
         label=_("Nombre Comercial"),
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ej. Juan's Telecom"),
-            'aria-describedby': 'nombre_comercial_help',
-            'autocomplete': 'organization'
-        }),
+        widget=forms.TextInput(attrs=NOMBRE_COMERCIAL_ATTRS),
         help_text=_("Nombre de marca o empresa del vendedor (opcional, se generará automáticamente si no se proporciona).")
     )
     rfc = forms.CharField(
         max_length=13,
         required=False,  # RFC ahora es opcional
         label=_("RFC"),
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ej. XAXX010101000"),
-            'aria-describedby': 'rfc_help',
-            'autocomplete': 'off'
-        }),
+        widget=forms.TextInput(attrs=RFC_ATTRS),
         validators=[
-            RegexValidator(
-                regex=r'^([A-ZÑ&]{3,4})\d{6}[A-Z0-9]{3}$',
-                message=_("Debe ser un RFC válido (ejemplo: XAXX010101000).")
-            )
+            RFC_VALIDATOR
         ],
         help_text=_("Registro Federal de Contribuyentes del vendedor (opcional).")
     )
@@ -121,30 +246,10 @@ class CrearVendedorForm(UserCreationForm):
         model = User
         fields = ['username', 'email', 'first_name', 'last_name', 'password1', 'password2', 'direccion', 'telefono', 'email_contacto', 'nombre_comercial', 'rfc']
         widgets = {
-            'username': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-                'placeholder': _("Ej. juanperez"),
-                'aria-describedby': 'username_help',
-                'autocomplete': 'username'
-            }),
-            'email': forms.EmailInput(attrs={
-                'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-                'placeholder': _("Ej. juan.perez@correo.com"),
-                'aria-describedby': 'email_help',
-                'autocomplete': 'email'
-            }),
-            'password1': forms.PasswordInput(attrs={
-                'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-                'placeholder': _("Contraseña"),
-                'aria-describedby': 'password1_help',
-                'autocomplete': 'new-password'
-            }),
-            'password2': forms.PasswordInput(attrs={
-                'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-                'placeholder': _("Confirmar contraseña"),
-                'aria-describedby': 'password2_help',
-                'autocomplete': 'new-password'
-            }),
+            'username': forms.TextInput(attrs=USERNAME_ATTRS),
+            'email': forms.EmailInput(attrs=EMAIL_ATTRS),
+            'password1': forms.PasswordInput(attrs=PASSWORD1_ATTRS),
+            'password2': forms.PasswordInput(attrs=PASSWORD2_ATTRS),
         }
         labels = {
             'username': _("Nombre de usuario"),
@@ -157,6 +262,9 @@ class CrearVendedorForm(UserCreationForm):
             'email': _("Correo principal para notificaciones (requerido)."),
             'password1': _("Mínimo 8 caracteres, con al menos una mayúscula, un número y no debe ser común."),
         }
+        error_messages = {
+            'username': {'unique': ERROR_USERNAME_TAKEN},
+        }
 
     def __init__(self, *args, **kwargs):
         """Inicializa el formulario, aceptando un argumento distribuidor."""
@@ -165,56 +273,64 @@ class CrearVendedorForm(UserCreationForm):
         self.fields['email'].required = True
 
     def clean_username(self):
-        """Valida unicidad y formato del nombre de usuario."""
+        """
+        Valida el formato del nombre de usuario.
+        La unicidad la garantiza el índice UNIQUE de la base de datos (validate_unique del ModelForm).
+        """
         username = normalize_username(self.cleaned_data['username'])
+        if USERNAME_RE.fullmatch(username):
+            return username
+        # Solo en el camino de error se distingue entre longitud y formato.
         if len(username) < 3 or len(username) > 150:
             raise ValidationError(
-                _("El nombre de usuario debe tener entre 3 y 150 caracteres."), code='length_invalid'
-            )
-        if not re.match(r'^[\w.@+-]+$', username):
-            raise ValidationError(
-                _("El nombre de usuario solo puede contener letras, números y @/./+/-/_"), code='format_invalid'
+                ERROR_USERNAME_LENGTH, code='length_invalid'
             )
-        if User.objects.filter(username__iexact=username).exists():
-            raise ValidationError(
-                _("El nombre de usuario ya está en uso."), code='unique_username'
-            )
-        return username
+        raise ValidationError(
+            ERROR_USERNAME_FORMAT, code='format_invalid'
+        )
 
     def clean_email(self):
-        """Valida unicidad del correo electrónico."""
+        """
+        Valida unicidad del correo electrónico.
+        Se conserva la consulta explícita: la restricción unique_email_case_insensitive es
+        funcional (Lower) y, sin este chequeo, el ModelForm la reportaría como error general.
+        """
         email = normalize_email(self.cleaned_data['email'])
         if not email:
             raise ValidationError(
-                _("El correo electrónico es obligatorio."), code='required_email'
+                ERROR_EMAIL_REQUIRED, code='required_email'
             )
-        if User.objects.filter(email__iexact=email).exists():
+        if email_registrado(email):
             raise ValidationError(
-                _("Ya existe una cuenta con este correo electrónico."), code='unique_email'
+                ERROR_EMAIL_TAKEN, code='unique_email'
             )
         return email
 
     def clean_email_contacto(self):
-        """Valida unicidad del correo de contacto."""
+        """
+        Valida unicidad del correo de contacto.
+        Si coincide con el correo principal se omite la consulta: clean() rechaza ese caso.
+        """
         email_contacto = normalize_email(self.cleaned_data.get('email_contacto', ''))
-        if email_contacto and User.objects.filter(email__iexact=email_contacto).exists():
+        if not email_contacto or email_contacto == self.cleaned_data.get('email'):
+            return email_contacto
+        if email_registrado(email_contacto):
             raise ValidationError(
-                _("El correo de contacto ya está registrado."), code='unique_email_contacto'
+                ERROR_EMAIL_CONTACTO_TAKEN, code='unique_email_contacto'
             )
         return email_contacto
 
     def clean_rfc(self):
-        """Valida unicidad y formato del RFC solo si se proporciona."""
+        """
+        Valida unicidad del RFC solo si se proporciona.
+        El formato ya lo verificó RFC_VALIDATOR al limpiar el campo.
+        """
         rfc = self.cleaned_data.get('rfc', '').strip().upper()
         if not rfc:
             return rfc  # Permitir RFC vacío
-        if not re.match(r'^([A-ZÑ&]{3,4})\d{6}[A-Z0-9]{3}$', rfc):
-            raise ValidationError(
-                _("Debe ser un RFC válido (ejemplo: XAXX010101000)."), code='invalid_rfc'
-            )
         if User.objects.filter(rfc=rfc).exists():
             raise ValidationError(
-                _("Ya existe una cuenta con este RFC."), code='unique_rfc'
+                ERROR_RFC_TAKEN, code='unique_rfc'
             )
         return rfc
 
@@ -225,7 +341,7 @@ class CrearVendedorForm(UserCreationForm):
         email_contacto = normalize_email(cleaned_data.get('email_contacto', ''))
         if email and email_contacto and email == email_contacto:
             raise ValidationError(
-                _("El correo principal y el correo de contacto no pueden ser iguales."),
+                ERROR_EMAIL_DUPLICADO,
                 code='duplicate_email'
             )
         # Ajustar nombre_comercial en cleaned_data para consistencia
@@ -233,58 +349,46 @@ class CrearVendedorForm(UserCreationForm):
         if not nombre_comercial:
             first_name = cleaned_data.get('first_name', '').strip()
             last_name = cleaned_data.get('last_name', '').strip()
-            if first_name or last_name:
-                cleaned_data['nombre_comercial'] = f"{first_name} {last_name}".strip()
+            if first_name and last_name:
+                cleaned_data['nombre_comercial'] = ' '.join((first_name, last_name))
+            elif first_name or last_name:
+                cleaned_data['nombre_comercial'] = first_name or last_name
             else:
                 cleaned_data['nombre_comercial'] = cleaned_data.get('username', '').strip()
         return cleaned_data
 
     def save(self, commit=True):
-        """Guarda el usuario vendedor y crea la relación DistribuidorVendedor."""
+        """
+        Crea el usuario vendedor y su relación con services.create_vendedores, el mismo alta que
+        usa la vista. No admite commit=False: el usuario y la relación no pueden quedar a medias.
+        """
+        if not commit:
+            raise ValueError("CrearVendedorForm.save() no admite commit=False; usa services.create_vendedores.")
         if not self.distribuidor:
             raise ValidationError(
-                _("Se requiere un distribuidor para crear la relación."), code='missing_distribuidor'
+                ERROR_MISSING_DISTRIBUIDOR, code='missing_distribuidor'
             )
         try:
-            with transaction.atomic():
-                user = super().save(commit=False)
-                user.rol = 'vendedor'
-                user.email = normalize_email(self.cleaned_data.get('email', ''))
-                user.username = normalize_username(self.cleaned_data['username'])
-                user.first_name = self.cleaned_data.get('first_name', '')
-                user.last_name = self.cleaned_data.get('last_name', '')
-                user.rfc = self.cleaned_data.get('rfc', '').strip().upper() or None  # Guardar None si RFC está vacío
-                user.hierarchy_root = self.distribuidor
-                if commit:
-                    user.save()
-                    # Garantizar que nombre_comercial siempre tenga un valor válido
-                    nombre_comercial = self.cleaned_data.get('nombre_comercial', '').strip()
-                    if not nombre_comercial:
-                        nombre_comercial = f"{user.first_name} {user.last_name}".strip()
-                    if not nombre_comercial:
-                        nombre_comercial = user.username
-                    DistribuidorVendedor.objects.create(
-                        distribuidor=self.distribuidor,
-                        vendedor=user,
-                        saldo_inicial=Decimal('0.00'),
-                        saldo_asignado=Decimal('0.00'),
-                        saldo_disponible=Decimal('0.00'),
-                        moneda='MXN',
-                        direccion_contacto=self.cleaned_data.get('direccion', ''),
-                        telefono_contacto=self.cleaned_data.get('telefono', ''),
-                        correo_contacto=self.cleaned_data.get('email_contacto', ''),
-                        nombre_comercial=nombre_comercial,
-                        es_creado_directamente=True,
-                        creado_por=self.distribuidor,
-                        activo=True
-                    )
-                return user
-        except Exception as e:
+            return create_vendedores(self.distribuidor, [self.cleaned_data])[0][0]
+        except IntegrityError as e:
+            # Carrera entre la validación y el INSERT: se traduce la violación UNIQUE al campo.
+            raise error_unicidad(e) from e
+
+class MontoBaseForm(forms.Form):
+    """
+    Base de los formularios de saldo: valida que el monto sea positivo.
+    Cada subclase declara su campo 'monto' con la etiqueta y ayuda correspondientes.
+    """
+    def clean_monto(self):
+        """Valida que el monto sea positivo."""
+        monto = self.cleaned_data.get('monto')
+        if monto is None or monto <= 0:
             raise ValidationError(
-                _("Error al crear el vendedor: ") + str(e), code='save_error'
+                ERROR_MONTO_INVALID, code='invalid_monto'
             )
+        return monto
 
-class AsignarSaldoForm(forms.Form):
+class AsignarSaldoForm(MontoBaseForm):
     """
     Formulario para asignar saldo adicional a un vendedor existente.
     Valida moneda y monto positivo con soporte para accesibilidad.
@@ -292,33 +396,13 @@ class AsignarSaldoForm(forms.Form):
     monto = forms.DecimalField(
         max_digits=15,
         decimal_places=2,
-        min_value=Decimal('0.01'),
+        min_value=MONTO_MINIMO,
         label=_("Monto a Asignar"),
-        widget=forms.NumberInput(attrs={
-            'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ej. 500.00"),
-            'step': '0.01',
-            'aria-describedby': 'monto_help',
-            'autocomplete': 'off'
-        }),
+        widget=forms.NumberInput(attrs=MONTO_ASIGNAR_ATTRS),
         help_text=_("Monto adicional a asignar al vendedor.")
     )
 
-    def __init__(self, *args, **kwargs):
-        """Inicializa el formulario con la relación existente para validar moneda."""
-        self.relacion = kwargs.pop('relacion', None)
-        super().__init__(*args, **kwargs)
-
-    def clean_monto(self):
-        """Valida que el monto sea positivo."""
-        monto = self.cleaned_data.get('monto')
-        if monto is None or monto <= 0:
-            raise ValidationError(
-                _("El monto debe ser mayor a cero."), code='invalid_monto'
-            )
-        return monto
-
-class DescontarSaldoForm(forms.Form):
+class DescontarSaldoForm(MontoBaseForm):
     """
     Formulario para descontar saldo disponible de un vendedor.
     Valida que el monto no exceda el saldo disponible con soporte para accesibilidad.
@@ -326,15 +410,9 @@ class DescontarSaldoForm(forms.Form):
     monto = forms.DecimalField(
         max_digits=15,
         decimal_places=2,
-        min_value=Decimal('0.01'),
+        min_value=MONTO_MINIMO,
         label=_("Monto a Descontar"),
-        widget=forms.NumberInput(attrs={
-            'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ej. 100.00"),
-            'step': '0.01',
-            'aria-describedby': 'monto_help',
-            'autocomplete': 'off'
-        }),
+        widget=forms.NumberInput(attrs=MONTO_DESCONTAR_ATTRS),
         help_text=_("Monto a descontar del saldo disponible.")
     )
 
@@ -344,15 +422,15 @@ class DescontarSaldoForm(forms.Form):
         super().__init__(*args, **kwargs)
 
     def clean_monto(self):
-        """Valida que el monto no exceda el saldo disponible."""
-        monto = self.cleaned_data.get('monto')
-        if monto is None or monto <= 0:
-            raise ValidationError(
-                _("El monto debe ser mayor a cero."), code='invalid_monto'
-            )
+        """
+        Valida que el monto no exceda el saldo disponible.
+        Es una prevalidación para mostrar el error en el formulario: form_valid vuelve a leer
+        la relación con select_for_update antes de descontar.
+        """
+        monto = super().clean_monto()
         if self.relacion and monto > self.relacion.saldo_disponible:
             raise ValidationError(
-                _("El monto excede el saldo disponible del vendedor."),
+                ERROR_MONTO_EXCEDE_SALDO,
                 code='exceed_saldo'
             )
         return monto
@@ -362,30 +440,26 @@ class DistribuidorVendedorForm(forms.ModelForm):
     Formulario para editar la relación Distribuidor-Vendedor.
     Maneja dirección y teléfono de contacto (saldo inicial se gestiona vía transacciones).
     """
+    telefono_contacto = forms.CharField(
+        max_length=20,
+        required=False,
+        label=_("Teléfono de Contacto"),
+        widget=forms.TextInput(attrs=TELEFONO_CONTACTO_ATTRS),
+        validators=[PHONE_VALIDATOR],
+        help_text=_("Teléfono en formato internacional (opcional).")
+    )
+
     class Meta:
         model = DistribuidorVendedor
         fields = ['direccion_contacto', 'telefono_contacto']
         widgets = {
-            'direccion_contacto': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-                'placeholder': _("Ej. Calle Falsa 123, CDMX"),
-                'aria-describedby': 'direccion_help',
-                'autocomplete': 'address-line1'
-            }),
-            'telefono_contacto': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-                'placeholder': _("Ej. +521234567890"),
-                'aria-describedby': 'telefono_contacto_help',
-                'autocomplete': 'tel'
-            }),
+            'direccion_contacto': forms.TextInput(attrs=DIRECCION_ATTRS),
         }
         labels = {
             'direccion_contacto': _("Dirección"),
-            'telefono_contacto': _("Teléfono de Contacto"),
         }
         help_texts = {
             'direccion_contacto': _("Dirección física o de contacto del vendedor (opcional)."),
-            'telefono_contacto': _("Teléfono en formato internacional (opcional)."),
         }
 
     def __init__(self, *args, **kwargs):
@@ -393,22 +467,12 @@ class DistribuidorVendedorForm(forms.ModelForm):
         self.distribuidor = kwargs.pop('distribuidor', None)
         super().__init__(*args, **kwargs)
 
-    def clean_telefono_contacto(self):
-        """Valida el formato del número de teléfono."""
-        telefono = self.cleaned_data.get('telefono_contacto', '').strip()
-        if telefono and not re.match(r'^\+?1?\d{10,15}$', telefono):
-            raise ValidationError(
-                _("El número de teléfono debe ser válido (10-15 dígitos, opcionalmente con +)."),
-                code='invalid_phone'
-            )
-        return telefono
-
     def save(self, commit=True):
         """Guarda la instancia asegurando que el distribuidor sea correcto."""
         instance = super().save(commit=False)
         if self.distribuidor and instance.distribuidor != self.distribuidor:
             raise ValidationError(
-                _("No tienes permiso para modificar esta relación."), code='invalid_distribuidor'
+                ERROR_DISTRIBUIDOR_INVALID, code='invalid_distribuidor'
             )
         if commit:
             instance.save()
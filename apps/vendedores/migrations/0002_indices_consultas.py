@@ -0,0 +1,47 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='distribuidorvendedor',
+            name='vendedores__distrib_2e9b1a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='distribuidorvendedor',
+            name='vendedores__activo_93aa0a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='distribuidorvendedor',
+            name='vendedores__uuid_44a1b6_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='distribuidorvendedor',
+            name='vendedores__es_crea_e73833_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='distribuidorvendedor',
+            name='vendedores__moneda_803016_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='distribuidorvendedorchangelog',
+            name='vendedores__relacio_861089_idx',
+        ),
+        migrations.AddIndex(
+            model_name='distribuidorvendedor',
+            index=models.Index(condition=models.Q(('activo', True)), fields=['distribuidor', '-fecha_creacion'], include=('id',), name='dv_active_by_dist'),
+        ),
+        migrations.AddIndex(
+            model_name='distribuidorvendedor',
+            index=models.Index(fields=['distribuidor', 'vendedor'], include=('saldo_disponible', 'moneda'), name='dv_covering'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:33
+
+from decimal import Decimal
+
+import apps.vendedores.fields
+import django.core.validators
+from django.db import migrations, models
+
+SALDO_FIELDS = ('saldo_inicial', 'saldo_asignado', 'saldo_disponible')
+
+
+def _escalar(apps, factor):
+    DistribuidorVendedor = apps.get_model('vendedores', 'DistribuidorVendedor')
+    DistribuidorVendedor.objects.update(**{
+        field: models.F(field) * factor for field in SALDO_FIELDS
+    })
+
+
+def a_centavos(apps, schema_editor):
+    _escalar(apps, 100)
+
+
+def a_unidades(apps, schema_editor):
+    _escalar(apps, Decimal('0.01'))
+
+
+def _decimal_amplio(name):
+    # Espacio suficiente para guardar centavos en NUMERIC antes del cambio a BIGINT
+    return migrations.AlterField(
+        model_name='distribuidorvendedor',
+        name=name,
+        field=models.DecimalField(decimal_places=2, default=0.0, max_digits=20,
+                                  validators=[django.core.validators.MinValueValidator(0.0)]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0002_indices_consultas'),
+    ]
+
+    operations = [
+        *[_decimal_amplio(name) for name in SALDO_FIELDS],
+        migrations.RunPython(a_centavos, a_unidades),
+        migrations.AlterField(
+            model_name='distribuidorvendedor',
+            name='saldo_asignado',
+            field=apps.vendedores.fields.CentsField(default=0, help_text='Monto total asignado por el distribuidor, incluyendo adiciones posteriores.', validators=[django.core.validators.MinValueValidator(0.0)], verbose_name='Saldo Asignado Total'),
+        ),
+        migrations.AlterField(
+            model_name='distribuidorvendedor',
+            name='saldo_disponible',
+            field=apps.vendedores.fields.CentsField(default=0, help_text='Monto disponible para operaciones del vendedor.', validators=[django.core.validators.MinValueValidator(0.0)], verbose_name='Saldo Disponible Actual'),
+        ),
+        migrations.AlterField(
+            model_name='distribuidorvendedor',
+            name='saldo_inicial',
+            field=apps.vendedores.fields.CentsField(default=0, help_text='Monto inicial asignado al vendedor al crear la relación.', validators=[django.core.validators.MinValueValidator(0.0)], verbose_name='Saldo Inicial'),
+        ),
+    ]
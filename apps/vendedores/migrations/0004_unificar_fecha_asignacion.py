@@ -0,0 +1,21 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:35
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0003_saldos_en_centavos'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='distribuidorvendedor',
+            name='vendedores__fecha_a_6441e9_idx',
+        ),
+        migrations.RemoveField(
+            model_name='distribuidorvendedor',
+            name='fecha_asignacion',
+        ),
+    ]
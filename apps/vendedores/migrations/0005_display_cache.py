@@ -0,0 +1,39 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:37
+
+from django.db import migrations, models
+
+
+def _nombre(user):
+    return f"{user.first_name} {user.last_name}".strip()
+
+
+def llenar_display_cache(apps, schema_editor):
+    DistribuidorVendedor = apps.get_model('vendedores', 'DistribuidorVendedor')
+    relaciones = DistribuidorVendedor.objects.select_related('distribuidor', 'vendedor').only(
+        'display_cache',
+        'distribuidor__first_name', 'distribuidor__last_name',
+        'vendedor__first_name', 'vendedor__last_name',
+    )
+    pendientes = []
+    for relacion in relaciones.iterator(chunk_size=1000):
+        relacion.display_cache = (
+            f"{_nombre(relacion.vendedor)} asignado por {_nombre(relacion.distribuidor)}"
+        )[:255]
+        pendientes.append(relacion)
+    DistribuidorVendedor.objects.bulk_update(pendientes, ['display_cache'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0004_unificar_fecha_asignacion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='distribuidorvendedor',
+            name='display_cache',
+            field=models.CharField(default='', editable=False, help_text='Nombres del vendedor y distribuidor usados al mostrar la relación.', max_length=255, verbose_name='Texto de presentación'),
+        ),
+        migrations.RunPython(llenar_display_cache, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Índice GIN (jsonb_path_ops) para búsquedas por contenido en los detalles de auditoría.
+# Solo aplica en PostgreSQL; en SQLite (desarrollo) la migración no hace nada.
+
+from django.db import migrations
+
+INDEX_NAME = 'dvcl_details_gin'
+TABLE_NAME = 'vendedores_distribuidorvendedorchangelog'
+
+
+def crear_indice(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{INDEX_NAME}" ON "{TABLE_NAME}" USING gin ("details" jsonb_path_ops)'
+    )
+
+
+def eliminar_indice(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0005_display_cache'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indice, eliminar_indice),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:39
+
+from django.db import migrations, models
+
+BRIN_INDEX_NAME = 'dvcl_ts_brin'
+
+
+def crear_indice_brin(apps, schema_editor):
+    # BRIN solo existe en PostgreSQL; en SQLite (desarrollo) no se crea
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{BRIN_INDEX_NAME}" ON "vendedores_distribuidorvendedorchangelog" '
+        'USING brin ("timestamp") WITH (pages_per_range = 32)'
+    )
+
+
+def eliminar_indice_brin(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{BRIN_INDEX_NAME}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0006_changelog_details_gin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='distribuidorvendedorchangelog',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True, help_text='Fecha y hora del cambio.', verbose_name='Fecha'),
+        ),
+        migrations.RunPython(crear_indice_brin, eliminar_indice_brin),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0007_changelog_timestamp_brin'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='distribuidorvendedor',
+            name='moneda',
+            field=models.CharField(default='MXN', help_text='Código ISO 4217 de la moneda del saldo (e.g., MXN, USD, EUR).', max_length=3, verbose_name='Moneda'),
+        ),
+        migrations.AlterField(
+            model_name='distribuidorvendedor',
+            name='telefono_contacto',
+            field=models.CharField(blank=True, help_text='Número telefónico del vendedor (WhatsApp, celular, fijo, etc., opcional).', max_length=20, verbose_name='Teléfono de Contacto'),
+        ),
+        migrations.AddConstraint(
+            model_name='distribuidorvendedor',
+            constraint=models.CheckConstraint(condition=models.Q(('moneda__regex', '^[A-Z]{3}$')), name='dv_moneda_iso', violation_error_message='La moneda debe ser un código ISO 4217 válido (e.g., MXN, USD, EUR).'),
+        ),
+        migrations.AddConstraint(
+            model_name='distribuidorvendedor',
+            constraint=models.CheckConstraint(condition=models.Q(('telefono_contacto', ''), ('telefono_contacto__regex', '^\\+?1?\\d{10,15}$'), _connector='OR'), name='dv_phone_fmt', violation_error_message='El número de teléfono debe ser válido (10-15 dígitos, opcionalmente con +).'),
+        ),
+    ]
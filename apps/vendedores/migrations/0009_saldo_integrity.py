@@ -0,0 +1,31 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0008_formatos_check'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='distribuidorvendedor',
+            name='saldo_disponible_no_excede_asignado',
+        ),
+        migrations.RemoveConstraint(
+            model_name='distribuidorvendedor',
+            name='saldo_disponible_no_negativo',
+        ),
+        migrations.RemoveConstraint(
+            model_name='distribuidorvendedor',
+            name='saldo_inicial_no_negativo',
+        ),
+        migrations.AddConstraint(
+            model_name='distribuidorvendedor',
+            constraint=models.CheckConstraint(condition=models.Q(('saldo_disponible__gte', 0), ('saldo_inicial__gte', 0), ('saldo_disponible__lte', models.F('saldo_asignado'))), name='dv_saldo_integrity', violation_error_message='Los saldos de la relación no son consistentes.'),
+        ),
+    ]
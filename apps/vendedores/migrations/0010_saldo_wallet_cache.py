@@ -0,0 +1,35 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:52
+
+import apps.vendedores.fields
+from django.db import migrations
+
+
+def copiar_saldo_wallet(apps, schema_editor):
+    DistribuidorVendedor = apps.get_model('vendedores', 'DistribuidorVendedor')
+    Wallet = apps.get_model('wallet', 'Wallet')
+    saldos = dict(Wallet.objects.exclude(balance=0).values_list('user_id', 'balance'))
+    if not saldos:
+        return
+    pendientes = []
+    relaciones = DistribuidorVendedor.objects.filter(vendedor_id__in=saldos).only('vendedor_id', 'saldo_wallet_cache')
+    for relacion in relaciones.iterator(chunk_size=1000):
+        relacion.saldo_wallet_cache = saldos[relacion.vendedor_id]
+        pendientes.append(relacion)
+    DistribuidorVendedor.objects.bulk_update(pendientes, ['saldo_wallet_cache'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0009_saldo_integrity'),
+        ('wallet', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='distribuidorvendedor',
+            name='saldo_wallet_cache',
+            field=apps.vendedores.fields.CentsField(default=0, editable=False, help_text='Copia de wallet.balance del vendedor, sincronizada por señales de Wallet.', verbose_name='Saldo de billetera'),
+        ),
+        migrations.RunPython(copiar_saldo_wallet, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendedores', '0010_saldo_wallet_cache'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='distribuidorvendedor',
+            index=models.Index(fields=['distribuidor', '-fecha_actualizacion'], name='dv_dist_actualizacion'),
+        ),
+    ]
@@ -3,18 +3,55 @@ Modelos para la gestión de vendedores en MexaRed.
 Define la relación entre distribuidores y vendedores, con soporte para contacto,
 auditoría, multi-moneda, y escalabilidad internacional de nivel empresarial.
 """
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.db.models import JSONField
-from django.core.validators import MinValueValidator, RegexValidator
+from django.core.validators import MinValueValidator
+import copy
 import uuid
 from decimal import Decimal
 
 import re
 
+from apps.vendedores import audit
+from apps.vendedores.exceptions import RelacionVendedorError
+from apps.vendedores.fields import CentsField
+
+
+PHONE_RE = re.compile(r'^\+?1?\d{10,15}$')
+CURRENCY_RE = re.compile(r'^[A-Z]{3}$')
+BULK_BATCH_SIZE = 1000
+ACTIVE_IDS_CACHE_TIMEOUT = 60 * 5
+
+
+def _copiar_valor(value):
+    """
+    Copia los valores mutables (JSON) para que los cambios in situ se detecten al comparar.
+    """
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+# Campos cuyo cambio se registra en el log de auditoría.
+TRACKED_FIELDS = (
+    'saldo_inicial', 'saldo_asignado', 'saldo_disponible', 'activo', 'moneda',
+    'direccion', 'direccion_contacto', 'telefono_contacto', 'correo_contacto',
+    'nombre_comercial', 'es_creado_directamente'
+)
+
+
+class DistribuidorVendedorQuerySet(models.QuerySet):
+    """
+    Consultas frecuentes sobre relaciones distribuidor-vendedor.
+    """
+
+    def con_usuarios(self):
+        """
+        Precarga distribuidor y vendedor en el mismo JOIN (usados por __str__ y las vistas).
+        """
+        return self.select_related('distribuidor', 'vendedor')
 
 
 class DistribuidorVendedor(models.Model):
@@ -52,47 +89,41 @@ class DistribuidorVendedor(models.Model):
     )
 
     # Saldo inicial asignado
-    saldo_inicial = models.DecimalField(
-        max_digits=10,
-        decimal_places=2,
-        default=0.00,
+    saldo_inicial = CentsField(
+        default=0,
         validators=[MinValueValidator(0.00)],
         verbose_name=_("Saldo Inicial"),
         help_text=_("Monto inicial asignado al vendedor al crear la relación.")
     )
 
     # Saldo asignado total
-    saldo_asignado = models.DecimalField(
-        max_digits=15,
-        decimal_places=2,
-        default=0.00,
+    saldo_asignado = CentsField(
+        default=0,
         validators=[MinValueValidator(0.00)],
         verbose_name=_("Saldo Asignado Total"),
         help_text=_("Monto total asignado por el distribuidor, incluyendo adiciones posteriores.")
     )
 
     # Saldo disponible actual
-    saldo_disponible = models.DecimalField(
-        max_digits=15,
-        decimal_places=2,
-        default=0.00,
+    saldo_disponible = CentsField(
+        default=0,
         validators=[MinValueValidator(0.00)],
         verbose_name=_("Saldo Disponible Actual"),
         help_text=_("Monto disponible para operaciones del vendedor.")
     )
+    saldo_wallet_cache = CentsField(
+        default=0,
+        editable=False,
+        verbose_name=_("Saldo de billetera"),
+        help_text=_("Copia de wallet.balance del vendedor, sincronizada por señales de Wallet.")
+    )
 
     # Moneda del saldo
     moneda = models.CharField(
         max_length=3,
         default='MXN',
         verbose_name=_("Moneda"),
-        help_text=_("Código ISO 4217 de la moneda del saldo (e.g., MXN, USD, EUR)."),
-        validators=[
-            RegexValidator(
-                regex=r'^[A-Z]{3}$',
-                message=_("La moneda debe ser un código ISO 4217 válido (e.g., MXN, USD, EUR).")
-            )
-        ]
+        help_text=_("Código ISO 4217 de la moneda del saldo (e.g., MXN, USD, EUR).")
     )
 
     # Estado de la relación
@@ -121,13 +152,7 @@ class DistribuidorVendedor(models.Model):
         max_length=20,
         blank=True,
         verbose_name=_("Teléfono de Contacto"),
-        help_text=_("Número telefónico del vendedor (WhatsApp, celular, fijo, etc., opcional)."),
-        validators=[
-            RegexValidator(
-                regex=r'^\+?1?\d{10,15}$',
-                message=_("El número de teléfono debe ser válido (10-15 dígitos, opcionalmente con +).")
-            )
-        ]
+        help_text=_("Número telefónico del vendedor (WhatsApp, celular, fijo, etc., opcional).")
     )
     correo_contacto = models.EmailField(
         blank=True,
@@ -149,11 +174,6 @@ class DistribuidorVendedor(models.Model):
     )
 
     # Fechas de auditoría
-    fecha_asignacion = models.DateTimeField(
-        auto_now_add=True,
-        verbose_name=_("Fecha de Asignación"),
-        help_text=_("Fecha en que se creó la relación (sin auditoría).")
-    )
     fecha_creacion = models.DateTimeField(
         auto_now_add=True,
         verbose_name=_("Fecha de Creación"),
@@ -190,39 +210,110 @@ class DistribuidorVendedor(models.Model):
         help_text=_("Configuraciones específicas en formato JSON (e.g., límites personalizados, comisiones).")
     )
 
+    # Texto de presentación desnormalizado para __str__ (evita recorrer las FK al renderizar)
+    display_cache = models.CharField(
+        max_length=255,
+        editable=False,
+        default='',
+        verbose_name=_("Texto de presentación"),
+        help_text=_("Nombres del vendedor y distribuidor usados al mostrar la relación.")
+    )
+
+    objects = DistribuidorVendedorQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Relación Distribuidor-Vendedor")
         verbose_name_plural = _("Relaciones Distribuidor-Vendedor")
         unique_together = ('distribuidor', 'vendedor')
         indexes = [
-            models.Index(fields=['distribuidor', 'vendedor']),
-            models.Index(fields=['activo']),
-            models.Index(fields=['uuid']),
+            # Vendedores activos de un distribuidor, del más reciente al más antiguo. Cubre el
+            # filtro y el orden del listado; con id incluido, get_active_ids_for() es index-only.
+            models.Index(
+                fields=['distribuidor', '-fecha_creacion'],
+                condition=models.Q(activo=True),
+                include=['id'],
+                name='dv_active_by_dist'
+            ),
+            # Permite consultar saldo y moneda sin leer la tabla (index-only scan en PostgreSQL)
+            models.Index(
+                fields=['distribuidor', 'vendedor'],
+                include=['saldo_disponible', 'moneda'],
+                name='dv_covering'
+            ),
+            # Última modificación por distribuidor (ETag del listado)
+            models.Index(fields=['distribuidor', '-fecha_actualizacion'], name='dv_dist_actualizacion'),
             models.Index(fields=['fecha_creacion']),
-            models.Index(fields=['fecha_asignacion']),
-            models.Index(fields=['es_creado_directamente']),
-            models.Index(fields=['moneda']),
         ]
         constraints = [
+            # Una sola expresión para los saldos; _validar_saldos() da el mensaje específico
             models.CheckConstraint(
-                check=models.Q(saldo_disponible__lte=models.F('saldo_asignado')),
-                name='saldo_disponible_no_excede_asignado',
-                violation_error_message=_("El saldo disponible no puede exceder el saldo asignado.")
+                check=(
+                    models.Q(saldo_disponible__gte=0)
+                    & models.Q(saldo_inicial__gte=0)
+                    & models.Q(saldo_disponible__lte=models.F('saldo_asignado'))
+                ),
+                name='dv_saldo_integrity',
+                violation_error_message=_("Los saldos de la relación no son consistentes.")
             ),
+            # Formatos validados por la base de datos (también aplican a bulk_create)
             models.CheckConstraint(
-                check=models.Q(saldo_disponible__gte=0),
-                name='saldo_disponible_no_negativo',
-                violation_error_message=_("El saldo disponible no puede ser negativo.")
+                check=models.Q(moneda__regex=CURRENCY_RE.pattern),
+                name='dv_moneda_iso',
+                violation_error_message=_("La moneda debe ser un código ISO 4217 válido (e.g., MXN, USD, EUR).")
             ),
             models.CheckConstraint(
-                check=models.Q(saldo_inicial__gte=0),
-                name='saldo_inicial_no_negativo',
-                violation_error_message=_("El saldo inicial no puede ser negativo.")
+                check=models.Q(telefono_contacto='') | models.Q(telefono_contacto__regex=PHONE_RE.pattern),
+                name='dv_phone_fmt',
+                violation_error_message=_("El número de teléfono debe ser válido (10-15 dígitos, opcionalmente con +).")
             ),
         ]
 
+    @property
+    def fecha_asignacion(self):
+        """
+        Alias de fecha_creacion; ambas columnas guardaban siempre el mismo valor.
+        """
+        return self.fecha_creacion
+
+    @staticmethod
+    def _active_ids_cache_key(distribuidor_id):
+        return f'vendedores_activos_{distribuidor_id}'
+
+    @classmethod
+    def get_active_ids_for(cls, distribuidor_id):
+        """
+        IDs de las relaciones activas del distribuidor, cacheados (no el queryset) para que
+        los saldos siempre se lean actualizados de la base de datos.
+        """
+        return cache.get_or_set(
+            cls._active_ids_cache_key(distribuidor_id),
+            lambda: list(
+                cls.objects.filter(distribuidor_id=distribuidor_id, activo=True).values_list('id', flat=True)
+            ),
+            ACTIVE_IDS_CACHE_TIMEOUT
+        )
+
+    @classmethod
+    def invalidar_active_ids(cls, *distribuidor_ids):
+        """
+        Invalida la lista cacheada de IDs activos al confirmar la transacción en curso.
+        """
+        keys = [cls._active_ids_cache_key(pk) for pk in set(distribuidor_ids) if pk is not None]
+        if keys:
+            transaction.on_commit(lambda: cache.delete_many(keys))
+
+    def actualizar_display_cache(self):
+        """
+        Recalcula display_cache a partir de los nombres del vendedor y del distribuidor.
+        """
+        self.display_cache = (
+            f"{self.vendedor.full_name} asignado por {self.distribuidor.full_name}"
+        )[:255]
+
     def __str__(self):
-        return f"{self.vendedor.full_name} ({self.moneda} {self.saldo_disponible}) asignado por {self.distribuidor.full_name}"
+        if not self.display_cache:
+            self.actualizar_display_cache()
+        return f"{self.display_cache} ({self.moneda} {self.saldo_disponible})"
 
     def clean(self):
         """
@@ -234,6 +325,35 @@ class DistribuidorVendedor(models.Model):
             raise ValidationError(_("El distribuidor debe tener rol 'distribuidor'."), code='invalid_distribuidor_role')
         if self.vendedor.rol != 'vendedor':
             raise ValidationError(_("El vendedor debe tener rol 'vendedor'."), code='invalid_vendedor_role')
+        self._validar_saldos()
+        if self.correo_contacto and self.correo_contacto == self.vendedor.email:
+            raise ValidationError(
+                _("El correo de contacto no puede ser igual al correo del vendedor."), code='duplicate_email'
+            )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Conserva los valores cargados para comparar cambios en save() sin volver a consultar.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            attname: _copiar_valor(value) for attname, value in zip(field_names, values)
+        }
+        return instance
+
+    def _snapshot(self):
+        """
+        Actualiza los valores de referencia con el estado actual de la instancia.
+        """
+        loaded = getattr(self, '_loaded_values', None)
+        attnames = loaded.keys() if loaded is not None else [f.attname for f in self._meta.concrete_fields]
+        self._loaded_values = {attname: _copiar_valor(self.__dict__.get(attname)) for attname in attnames}
+
+    def _validar_saldos(self):
+        """
+        Verifica la consistencia de los saldos sin consultar la base de datos.
+        """
         if self.saldo_disponible > self.saldo_asignado:
             raise ValidationError(
                 _("El saldo disponible no puede exceder el saldo asignado."), code='saldo_exceed'
@@ -242,145 +362,258 @@ class DistribuidorVendedor(models.Model):
             raise ValidationError(_("El saldo disponible no puede ser negativo."), code='saldo_negative')
         if self.saldo_inicial < 0:
             raise ValidationError(_("El saldo inicial no puede ser negativo."), code='saldo_inicial_negative')
-        if self.correo_contacto and self.correo_contacto == self.vendedor.email:
-            raise ValidationError(
-                _("El correo de contacto no puede ser igual al correo del vendedor."), code='duplicate_email'
-            )
-        if self.telefono_contacto and not re.match(r'^\+?1?\d{10,15}$', self.telefono_contacto):
-            raise ValidationError(
-                _("El número de teléfono de contacto debe ser válido (10-15 dígitos, opcionalmente con +)."),
-                code='invalid_phone'
-            )
 
     def save(self, *args, **kwargs):
         """
-        Sobrescribe save para ejecutar validaciones y registrar auditoría.
+        Sobrescribe save para registrar auditoría.
+        La validación completa (full_clean) corre en formularios y admin, o en save()
+        si VENDEDORES_VALIDATE_ON_SAVE está activo (ver signals.py).
         """
-        self.full_clean()
         is_new = self.pk is None
+        loaded = None if is_new else getattr(self, '_loaded_values', None)
         changes = {}
 
-        if not is_new:
-            try:
-                old_instance = DistribuidorVendedor.objects.get(pk=self.pk)
-                fields_to_track = [
-                    'saldo_inicial', 'saldo_asignado', 'saldo_disponible', 'activo', 'moneda',
-                    'direccion', 'direccion_contacto', 'telefono_contacto', 'correo_contacto',
-                    'nombre_comercial', 'es_creado_directamente'
+        if is_new or loaded is None or any(
+            loaded.get(attname) != getattr(self, attname) for attname in ('distribuidor_id', 'vendedor_id')
+        ):
+            self.actualizar_display_cache()
+
+        if loaded is not None:
+            for field in TRACKED_FIELDS:
+                if field not in loaded:
+                    continue
+                old_value = loaded[field]
+                new_value = getattr(self, field)
+                if old_value != new_value:
+                    changes[field] = {"before": str(old_value), "after": str(new_value)}
+
+            old_activo = loaded.get('activo', self.activo)
+            if self.activo is False and old_activo is True:
+                self.fecha_desactivacion = timezone.now()
+            elif self.activo is True and old_activo is False:
+                self.fecha_desactivacion = None
+
+            # Solo escribe las columnas modificadas
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                update_fields = [
+                    field.name for field in self._meta.concrete_fields
+                    if field.attname in self.__dict__
+                    and self.__dict__[field.attname] != loaded.get(field.attname, models.DEFERRED)
                 ]
-                for field in fields_to_track:
-                    old_value = getattr(old_instance, field)
-                    new_value = getattr(self, field)
-                    if old_value != new_value:
-                        changes[field] = {"before": str(old_value), "after": str(new_value)}
-            except DistribuidorVendedor.DoesNotExist:
-                changes = {}
-
-        if not is_new and self.activo is False and old_instance.activo is True:
-            self.fecha_desactivacion = timezone.now()
-        elif not is_new and self.activo is True and old_instance.activo is False:
-            self.fecha_desactivacion = None
+            if update_fields:
+                update_fields = set(update_fields) | {'fecha_actualizacion'}
+                if 'activo' in update_fields:
+                    update_fields.add('fecha_desactivacion')
+            kwargs['update_fields'] = update_fields
 
         # Initialize saldo_asignado and saldo_disponible with saldo_inicial if new
         if is_new and self.saldo_inicial > 0:
             self.saldo_asignado = self.saldo_inicial
             self.saldo_disponible = self.saldo_inicial
+        self._validar_saldos()
 
         super().save(*args, **kwargs)
+        if is_new or loaded is None or loaded.get('activo') != self.activo \
+                or loaded.get('distribuidor_id') != self.distribuidor_id:
+            self.invalidar_active_ids(self.distribuidor_id, (loaded or {}).get('distribuidor_id'))
+        self._snapshot()
 
         # Registrar en log de auditoría
         if is_new:
-            DistribuidorVendedorChangeLog.objects.create(
+            audit.queue(DistribuidorVendedorChangeLog(
                 relacion=self,
-                changed_by=self.creado_por,
+                changed_by_id=self.creado_por_id,
                 change_type='create',
                 change_description=_("Creación de relación distribuidor-vendedor")
-            )
+            ))
         elif changes:
-            DistribuidorVendedorChangeLog.objects.create(
+            audit.queue(DistribuidorVendedorChangeLog(
                 relacion=self,
-                changed_by=self.creado_por,
+                changed_by_id=self.creado_por_id,
                 change_type='update',
                 change_description=_("Actualización de: ") + ', '.join(changes.keys()),
                 details=changes
-            )
+            ))
+
+    def _recargar(self, *fields):
+        """
+        Recarga los campos indicados desde la base de datos y actualiza su valor de referencia.
+        """
+        self.refresh_from_db(fields=fields)
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is not None:
+            loaded.update({field: getattr(self, field) for field in fields})
 
     def asignar_saldo(self, monto, moneda=None, changed_by=None):
         """
-        Asigna saldo adicional al vendedor, actualizando moneda si es necesario.
+        Asigna saldo adicional al vendedor con un UPDATE atómico en la base de datos.
         """
+        if not isinstance(monto, Decimal):
+            monto = Decimal(str(monto))
         if monto <= 0:
-            raise ValueError(_("El monto debe ser positivo."), code='invalid_monto')
+            raise RelacionVendedorError(_("El monto debe ser positivo."), code='invalid_monto')
         if moneda and moneda != self.moneda:
-            raise ValueError(_("La moneda no coincide con la configurada."), code='moneda_mismatch')
-
-        self.saldo_asignado += Decimal(str(monto))
-        self.saldo_disponible += Decimal(str(monto))
-        self.save()
-
-        DistribuidorVendedorChangeLog.objects.create(
-            relacion=self,
-            changed_by=changed_by,
-            change_type='update',
-            change_description=_("Asignación de saldo"),
-            details={"monto": str(monto), "moneda": self.moneda}
-        )
+            raise RelacionVendedorError(_("La moneda no coincide con la configurada."), code='moneda_mismatch')
+
+        centavos = CentsField.to_cents(monto)
+        with transaction.atomic():
+            DistribuidorVendedor.objects.filter(pk=self.pk).update(
+                saldo_asignado=models.F('saldo_asignado') + centavos,
+                saldo_disponible=models.F('saldo_disponible') + centavos,
+                fecha_actualizacion=timezone.now()
+            )
+            audit.queue(DistribuidorVendedorChangeLog(
+                relacion=self,
+                changed_by=changed_by,
+                change_type='update',
+                change_description=_("Asignación de saldo"),
+                details={"monto": str(monto), "moneda": self.moneda}
+            ))
+        self._recargar('saldo_asignado', 'saldo_disponible', 'fecha_actualizacion')
 
     def descontar_saldo(self, monto, moneda=None, changed_by=None):
         """
-        Descuenta saldo del vendedor, con validaciones estrictas.
+        Descuenta saldo del vendedor con un UPDATE condicionado al saldo disponible.
         """
+        if not isinstance(monto, Decimal):
+            monto = Decimal(str(monto))
         if monto <= 0:
-            raise ValueError(_("El monto debe ser positivo."), code='invalid_monto')
+            raise RelacionVendedorError(_("El monto debe ser positivo."), code='invalid_monto')
         if moneda and moneda != self.moneda:
-            raise ValueError(_("La moneda no coincide con la configurada."), code='moneda_mismatch')
-        if monto > self.saldo_disponible:
-            raise ValueError(_("Saldo insuficiente."), code='insufficient_saldo')
-
-        self.saldo_disponible -= Decimal(str(monto))
-        self.save()
+            raise RelacionVendedorError(_("La moneda no coincide con la configurada."), code='moneda_mismatch')
+
+        centavos = CentsField.to_cents(monto)
+        with transaction.atomic():
+            updated = DistribuidorVendedor.objects.filter(
+                pk=self.pk, saldo_disponible__gte=monto
+            ).update(
+                saldo_disponible=models.F('saldo_disponible') - centavos,
+                fecha_actualizacion=timezone.now()
+            )
+            if not updated:
+                raise RelacionVendedorError(_("Saldo insuficiente."), code='insufficient_saldo')
+            audit.queue(DistribuidorVendedorChangeLog(
+                relacion=self,
+                changed_by=changed_by,
+                change_type='update',
+                change_description=_("Descuento de saldo"),
+                details={"monto": str(monto), "moneda": self.moneda}
+            ))
+        self._recargar('saldo_disponible', 'fecha_actualizacion')
 
-        DistribuidorVendedorChangeLog.objects.create(
-            relacion=self,
-            changed_by=changed_by,
-            change_type='update',
-            change_description=_("Descuento de saldo"),
-            details={"monto": str(monto), "moneda": self.moneda}
-        )
+    def _cambiar_activo(self, activo):
+        """
+        Cambia `activo` con un UPDATE condicionado al estado actual; devuelve False si ya lo tenía.
+        """
+        ahora = timezone.now()
+        valores = {
+            'activo': activo,
+            'fecha_desactivacion': None if activo else ahora,
+            'fecha_actualizacion': ahora,
+        }
+        if not DistribuidorVendedor.objects.filter(pk=self.pk, activo=not activo).update(**valores):
+            return False
+        for field, value in valores.items():
+            setattr(self, field, value)
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is not None:
+            loaded.update(valores)
+        self.invalidar_active_ids(self.distribuidor_id)
+        return True
 
     def desactivar(self, changed_by=None):
         """
-        Desactiva la relación, registrando la acción.
+        Desactiva la relación con un UPDATE de dos columnas, registrando la acción.
         """
-        if not self.activo:
-            raise ValueError(_("La relación ya está desactivada."), code='already_deactivated')
-        self.activo = False
-        self.fecha_desactivacion = timezone.now()
-        self.save()
+        if not self._cambiar_activo(False):
+            raise RelacionVendedorError(_("La relación ya está desactivada."), code='already_deactivated')
 
-        DistribuidorVendedorChangeLog.objects.create(
+        audit.queue(DistribuidorVendedorChangeLog(
             relacion=self,
             changed_by=changed_by,
             change_type='deactivate',
             change_description=_("Desactivación de vendedor")
-        )
+        ))
 
     def reactivar(self, changed_by=None):
         """
-        Reactiva la relación, limpiando la fecha de desactivación.
+        Reactiva la relación limpiando la fecha de desactivación, registrando la acción.
         """
-        if self.activo:
-            raise ValueError(_("La relación ya está activa."), code='already_active')
-        self.activo = True
-        self.fecha_desactivacion = None
-        self.save()
+        if not self._cambiar_activo(True):
+            raise RelacionVendedorError(_("La relación ya está activa."), code='already_active')
 
-        DistribuidorVendedorChangeLog.objects.create(
+        audit.queue(DistribuidorVendedorChangeLog(
             relacion=self,
             changed_by=changed_by,
             change_type='reactivate',
             change_description=_("Reactivación de vendedor")
+        ))
+
+    @classmethod
+    def bulk_import(cls, items, creado_por):
+        """
+        Crea relaciones en lote (alta masiva de vendedores) con un solo INSERT multi-fila.
+        items es una lista de diccionarios con los campos del modelo. Se valida todo el lote
+        con las reglas locales antes de insertar; las FK y saldos los respaldan los constraints.
+        """
+        relaciones = [cls(creado_por=creado_por, es_creado_directamente=True, **item) for item in items]
+
+        errores = []
+        for fila, relacion in enumerate(relaciones, start=1):
+            if relacion.saldo_inicial > 0:
+                relacion.saldo_asignado = relacion.saldo_inicial
+                relacion.saldo_disponible = relacion.saldo_inicial
+            if relacion.telefono_contacto and not PHONE_RE.match(relacion.telefono_contacto):
+                errores.append(ValidationError(
+                    _("Fila %(fila)s: el número de teléfono de contacto no es válido."),
+                    code='invalid_phone', params={'fila': fila}
+                ))
+            if not CURRENCY_RE.match(relacion.moneda):
+                errores.append(ValidationError(
+                    _("Fila %(fila)s: la moneda debe ser un código ISO 4217 válido."),
+                    code='invalid_moneda', params={'fila': fila}
+                ))
+            try:
+                relacion._validar_saldos()
+            except ValidationError as e:
+                errores.extend(
+                    ValidationError(_("Fila %(fila)s: %(error)s"), code=error.code,
+                                    params={'fila': fila, 'error': error.message})
+                    for error in e.error_list
+                )
+        if errores:
+            raise ValidationError(errores)
+
+        # Nombres para display_cache y balance de billetera en una sola consulta; bulk_create no
+        # dispara post_save, así que saldo_wallet_cache se inicializa aquí.
+        User = cls._meta.get_field('vendedor').related_model
+        user_ids = {r.vendedor_id for r in relaciones} | {r.distribuidor_id for r in relaciones}
+        usuarios = (
+            User.objects.only('first_name', 'last_name')
+            .annotate(balance_wallet=models.F('wallet__balance'))
+            .in_bulk(user_ids)
         )
+        for relacion in relaciones:
+            for field in ('vendedor', 'distribuidor'):
+                usuario = usuarios.get(getattr(relacion, f'{field}_id'))
+                if usuario is not None:
+                    setattr(relacion, field, usuario)
+            vendedor = usuarios.get(relacion.vendedor_id)
+            relacion.saldo_wallet_cache = (vendedor and vendedor.balance_wallet) or 0
+            relacion.actualizar_display_cache()
+
+        with transaction.atomic():
+            cls.objects.bulk_create(relaciones, batch_size=BULK_BATCH_SIZE)
+            cls.invalidar_active_ids(*(r.distribuidor_id for r in relaciones))
+            for relacion in relaciones:
+                audit.queue(DistribuidorVendedorChangeLog(
+                    relacion=relacion,
+                    changed_by=creado_por,
+                    change_type='create',
+                    change_description=_("Creación de relación distribuidor-vendedor")
+                ))
+        return relaciones
 
 
 class DistribuidorVendedorChangeLog(models.Model):
@@ -418,14 +651,16 @@ class DistribuidorVendedorChangeLog(models.Model):
         blank=True,
         help_text=_("Descripción del cambio realizado.")
     )
+    # En PostgreSQL tiene un índice GIN jsonb_path_ops (dvcl_details_gin) para consultas details__contains
     details = JSONField(
         default=dict,
         blank=True,
         verbose_name=_("Detalles"),
         help_text=_("Detalles específicos del cambio en formato JSON.")
     )
+    # Tabla de solo inserción: en PostgreSQL se indexa con BRIN (dvcl_ts_brin)
     timestamp = models.DateTimeField(
-        default=timezone.now,
+        auto_now_add=True,
         verbose_name=_("Fecha"),
         help_text=_("Fecha y hora del cambio.")
     )
@@ -434,9 +669,10 @@ class DistribuidorVendedorChangeLog(models.Model):
         verbose_name = _("Registro de Cambio Distribuidor-Vendedor")
         verbose_name_plural = _("Registros de Cambios Distribuidor-Vendedor")
         indexes = [
-            models.Index(fields=['relacion', 'timestamp']),
             models.Index(fields=['change_type']),
         ]
 
     def __str__(self):
-        return f"{self.change_type} en {self.relacion} ({self.timestamp})"
\ No newline at end of file
+        relacion_field = self._meta.get_field('relacion')
+        relacion = self.relacion if relacion_field.is_cached(self) else f"#{self.relacion_id}"
+        return f"{self.change_type} en {relacion} ({self.timestamp})"
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+Servicios del módulo de vendedores.
+Alta de vendedores (usuario + relación con el distribuidor) y envío de sus correos de bienvenida,
+reutilizables por la vista de creación y por cualquier proceso de alta masiva.
+"""
+import logging
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils.translation import gettext_lazy as _
+
+from apps.vendedores.models import DistribuidorVendedor
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+def create_vendedores(distribuidor, rows):
+    """
+    Crea un usuario vendedor y su relación con el distribuidor por cada fila de `rows`.
+
+    Cada fila es un diccionario con los datos limpios de CrearVendedorForm (username, email,
+    password1, first_name, last_name, rfc, direccion, telefono, email_contacto, nombre_comercial).
+    Los usuarios se guardan uno a uno porque User.save() y sus señales validan, generan el
+    codigo_id y crean la wallet; las relaciones se insertan todas juntas con bulk_import().
+    Devuelve una lista de tuplas (usuario, relación) en el orden de `rows`.
+    """
+    with transaction.atomic():
+        usuarios = []
+        for row in rows:
+            user = User(
+                username=row['username'],
+                email=row['email'],
+                first_name=row.get('first_name', ''),
+                last_name=row.get('last_name', ''),
+                rfc=row.get('rfc') or None,
+                rol='vendedor',
+                hierarchy_root=distribuidor,
+            )
+            user.set_password(row['password1'])
+            user.save()
+            usuarios.append(user)
+
+        relaciones = DistribuidorVendedor.bulk_import(
+            [
+                {
+                    'distribuidor': distribuidor,
+                    'vendedor': user,
+                    'moneda': 'MXN',
+                    'direccion_contacto': row.get('direccion', ''),
+                    'telefono_contacto': row.get('telefono', ''),
+                    'correo_contacto': row.get('email_contacto', ''),
+                    'nombre_comercial': row.get('nombre_comercial') or user.full_name,
+                    'activo': True,
+                }
+                for user, row in zip(usuarios, rows)
+            ],
+            creado_por=distribuidor,
+        )
+    logger.info(f"{len(usuarios)} vendedor(es) creados por distribuidor {distribuidor.username}")
+    return list(zip(usuarios, relaciones))
+
+
+def send_welcome_emails(distribuidor, credenciales, login_url):
+    """
+    Envía el correo de bienvenida (texto + HTML) a cada vendedor de `credenciales`, una lista de
+    tuplas (usuario, contraseña), abriendo una sola conexión SMTP para todo el lote.
+    Los usuarios sin correo se omiten. Devuelve el número de mensajes enviados.
+    """
+    subject = _("Bienvenido a MexaRed - Credenciales de Acceso")
+    support_email = settings.SUPPORT_EMAIL or settings.DEFAULT_FROM_EMAIL
+    connection = get_connection()
+    mensajes = []
+    for user, password in credenciales:
+        if not user.email:
+            logger.warning(f"Vendedor {user.username} sin correo: se omite el correo de bienvenida")
+            continue
+        context = {
+            'user': user,
+            'password': password,
+            'site_name': "MexaRed",
+            'login_url': login_url,
+            'distribuidor': distribuidor.full_name,
+            'support_email': support_email,
+        }
+        mensaje = EmailMultiAlternatives(
+            subject,
+            render_to_string('vendedores/emails/welcome_email.txt', context),
+            settings.DEFAULT_FROM_EMAIL,
+            [user.email],
+            connection=connection,
+        )
+        mensaje.attach_alternative(render_to_string('vendedores/emails/welcome_email.html', context), 'text/html')
+        mensajes.append(mensaje)
+
+    if not mensajes:
+        return 0
+    destinatarios = ', '.join(m.to[0] for m in mensajes)
+    try:
+        enviados = connection.send_messages(mensajes)
+    except Exception as e:
+        logger.error(f"Error al enviar correo a {destinatarios}: {str(e)}")
+        raise
+    logger.info(f"Correo de bienvenida enviado a {destinatarios}")
+    return enviados
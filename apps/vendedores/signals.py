@@ -0,0 +1,95 @@
+"""
+Señales del módulo de vendedores.
+Invalidan la caché de vendedores activos al eliminar relaciones y mantienen saldo_wallet_cache
+sincronizado con wallet.balance y display_cache con los nombres de los usuarios.
+La validación completa en save() es opcional y se activa con VENDEDORES_VALIDATE_ON_SAVE;
+formularios y admin ya la ejecutan mediante full_clean().
+"""
+from django.conf import settings
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.users.models import User
+from apps.wallet.models import Wallet
+
+from .models import DistribuidorVendedor
+
+
+@receiver(pre_save, sender=DistribuidorVendedor)
+def validar_relacion(sender, instance, raw, update_fields=None, **kwargs):
+    """
+    Ejecuta full_clean() antes de guardar cuando la configuración lo solicita.
+    """
+    if raw or not getattr(settings, 'VENDEDORES_VALIDATE_ON_SAVE', False):
+        return
+    instance.full_clean()
+
+
+@receiver(post_delete, sender=DistribuidorVendedor)
+def invalidar_ids_activos(sender, instance, **kwargs):
+    """
+    Mantiene consistente la lista cacheada de vendedores activos al eliminar una relación.
+    """
+    DistribuidorVendedor.invalidar_active_ids(instance.distribuidor_id)
+
+
+@receiver(post_save, sender=DistribuidorVendedor)
+def copiar_saldo_wallet(sender, instance, created, raw, **kwargs):
+    """
+    Inicializa saldo_wallet_cache de una relación nueva con el balance actual de la billetera.
+    """
+    if raw or not created:
+        return
+    balance = Wallet.objects.filter(user_id=instance.vendedor_id).values_list('balance', flat=True).first()
+    if not balance:
+        return
+    DistribuidorVendedor.objects.filter(pk=instance.pk).update(saldo_wallet_cache=balance)
+    instance.saldo_wallet_cache = balance
+    instance._snapshot()
+
+
+@receiver(post_save, sender=Wallet)
+def sincronizar_saldo_wallet(sender, instance, raw, update_fields=None, **kwargs):
+    """
+    Replica wallet.balance en las relaciones del vendedor con un solo UPDATE, sin pasar por save().
+    """
+    if raw or (update_fields is not None and 'balance' not in update_fields):
+        return
+    if kwargs.get('created') and not instance.balance:
+        return
+    DistribuidorVendedor.objects.filter(vendedor_id=instance.user_id).update(
+        saldo_wallet_cache=instance.balance,
+        fecha_actualizacion=timezone.now()
+    )
+
+
+@receiver(post_save, sender=User)
+def actualizar_display_relaciones(sender, instance, created, raw, update_fields=None, **kwargs):
+    """
+    Recalcula display_cache de las relaciones del usuario (como vendedor o distribuidor) cuando
+    cambia su nombre. Solo se escriben las relaciones cuyo texto cambió, con un bulk_update.
+    """
+    if raw or created:
+        return
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        return
+    relaciones = (
+        DistribuidorVendedor.objects
+        .filter(Q(vendedor_id=instance.pk) | Q(distribuidor_id=instance.pk))
+        .select_related('vendedor', 'distribuidor')
+        .only(
+            'pk', 'display_cache',
+            'vendedor__first_name', 'vendedor__last_name',
+            'distribuidor__first_name', 'distribuidor__last_name',
+        )
+    )
+    cambiadas = []
+    for relacion in relaciones:
+        anterior = relacion.display_cache
+        relacion.actualizar_display_cache()
+        if relacion.display_cache != anterior:
+            cambiadas.append(relacion)
+    if cambiadas:
+        DistribuidorVendedor.objects.bulk_update(cambiadas, ['display_cache'], batch_size=500)
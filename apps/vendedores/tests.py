@@ -0,0 +1,88 @@
+from django.db import transaction
+from django.test import TestCase
+
+from apps.users.models import User
+from apps.vendedores import audit
+from apps.vendedores.models import DistribuidorVendedor, DistribuidorVendedorChangeLog
+
+
+class _Revertir(Exception):
+    pass
+
+
+class AuditQueueTests(TestCase):
+    """
+    Registros de auditoría diferidos con audit.queue() y savepoints anidados.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            'admin1', 'admin@example.com', 'Passw0rd!!x', first_name='Admin', last_name='Uno'
+        )
+        cls.distribuidor = User.objects.create_user(
+            'dist1', 'dist@example.com', 'Passw0rd!!x', rol='distribuidor',
+            first_name='Dist', last_name='Uno', hierarchy_root=cls.admin
+        )
+        cls.vendedores = [
+            User.objects.create_user(
+                f'vend{i}', f'vend{i}@example.com', 'Passw0rd!!x', rol='vendedor',
+                first_name='Vend', last_name=str(i), hierarchy_root=cls.distribuidor
+            )
+            for i in range(2)
+        ]
+        cls.relacion = DistribuidorVendedor.objects.create(
+            distribuidor=cls.distribuidor, vendedor=cls.vendedores[0], creado_por=cls.admin
+        )
+
+    def _log(self, descripcion, relacion=None):
+        return DistribuidorVendedorChangeLog(
+            relacion=relacion or self.relacion, change_type='update', change_description=descripcion
+        )
+
+    def _descripciones(self):
+        return list(
+            DistribuidorVendedorChangeLog.objects
+            .filter(change_type='update').order_by('pk').values_list('change_description', flat=True)
+        )
+
+    def test_savepoint_revertido_descarta_sus_registros(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                audit.queue(self._log('outer'))
+                try:
+                    with transaction.atomic():
+                        audit.queue(self._log('inner-rolled-back'))
+                        raise _Revertir
+                except _Revertir:
+                    pass
+                audit.queue(self._log('outer-after'))
+        self.assertEqual(self._descripciones(), ['outer', 'outer-after'])
+
+    def test_savepoint_revertido_con_relacion_nueva(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                audit.queue(self._log('outer'))
+                try:
+                    with transaction.atomic():
+                        relacion = DistribuidorVendedor.objects.create(
+                            distribuidor=self.distribuidor, vendedor=self.vendedores[1], creado_por=self.admin
+                        )
+                        audit.queue(self._log('inner-rolled-back', relacion))
+                        raise _Revertir
+                except _Revertir:
+                    pass
+        self.assertEqual(self._descripciones(), ['outer'])
+
+    def test_savepoint_confirmado_se_une_al_lote_padre(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                audit.queue(self._log('outer'))
+                with transaction.atomic():
+                    audit.queue(self._log('inner'))
+                audit.queue(self._log('outer-after'))
+        # Un solo INSERT: el lote del savepoint se vació en el del nivel superior
+        with self.assertNumQueries(1):
+            for callback in callbacks:
+                callback()
+        self.assertEqual(self._descripciones(), ['outer', 'inner', 'outer-after'])
@@ -24,14 +24,14 @@ urlpatterns = [
     path('crear/', DistribuidorVendedorCreateView.as_view(), name='crear'),
     
     # 💸 Asignar saldo adicional a un vendedor existente
-    path('<int:pk>/asignar-saldo/', AsignarSaldoView.as_view(), name='asignar_saldo'),
+    path('<uuid:uuid>/asignar-saldo/', AsignarSaldoView.as_view(), name='asignar_saldo'),
     
     # 🧾 Descontar saldo disponible de un vendedor
-    path('<int:pk>/descontar-saldo/', DescontarSaldoView.as_view(), name='descontar_saldo'),
+    path('<uuid:uuid>/descontar-saldo/', DescontarSaldoView.as_view(), name='descontar_saldo'),
     
 
-    path('editar/<int:pk>/', DistribuidorVendedorUpdateView.as_view(), name='editar'),
+    path('editar/<uuid:uuid>/', DistribuidorVendedorUpdateView.as_view(), name='editar'),
 
-    # 🔄 Activar o desactivar un vendedor
-    path('<int:pk>/toggle-active/', DistribuidorVendedorToggleActiveView.as_view(), name='toggle_active'),
+    # 🔄 Activar o desactivar un vendedor (confirmación por GET, cambio por POST)
+    path('<uuid:uuid>/toggle-active/', DistribuidorVendedorToggleActiveView.as_view(), name='toggle_active'),
 ]
\ No newline at end of file
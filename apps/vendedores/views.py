@@ -6,38 +6,96 @@ Incluye auditoría avanzada, optimización de consultas, y soporte multilenguaje
 Cumple con estándares internacionales (PCI DSS, SOC2, ISO 27001) y escalabilidad SaaS.
 """
 
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import redirect, get_object_or_404
 from django.contrib import messages
 from django.urls import reverse_lazy
-from django.views.generic import ListView, CreateView, FormView, UpdateView
+from django.views.generic import ListView, CreateView, FormView, TemplateView, UpdateView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import PermissionDenied, ValidationError
-from django.db import transaction
-from django.utils import timezone
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.views.decorators.http import condition
 from django.views.decorators.vary import vary_on_cookie
 from django.contrib.auth import get_user_model
 from django.db import models
 from decimal import Decimal
 import logging
-import uuid
-import re
 
+from apps.vendedores.exceptions import RelacionVendedorError
 from apps.vendedores.models import DistribuidorVendedor
-from apps.vendedores.forms import CrearVendedorForm, AsignarSaldoForm, DescontarSaldoForm, DistribuidorVendedorForm
-from apps.wallet.models import Wallet
+from apps.vendedores.forms import CrearVendedorForm, AsignarSaldoForm, DescontarSaldoForm, DistribuidorVendedorForm, error_unicidad
+from apps.vendedores.services import create_vendedores, send_welcome_emails
 
 # Configurar logger para auditoría profesional
 logger = logging.getLogger('apps.vendedores')
 
 User = get_user_model()
 
+# Columnas que renderiza vendedores/lista.html; cualquier campo nuevo en la plantilla
+# debe agregarse aquí para no provocar una consulta diferida por fila.
+LISTA_FIELDS = (
+    'uuid', 'activo', 'saldo_disponible', 'fecha_creacion',
+    'saldo_wallet_cache', 'nombre_comercial', 'telefono_contacto',
+    'vendedor__first_name', 'vendedor__last_name', 'vendedor__email',
+)
+
+ANALYTICS_CACHE_TIMEOUT = 60 * 10
+
+
+def _analytics_version_key(distribuidor_id):
+    return f'vend_analytics_ver_{distribuidor_id}'
+
+
+def invalidar_analytics(distribuidor_id):
+    """
+    Incrementa la versión de las analíticas del distribuidor al confirmar la transacción,
+    dejando obsoletas de una vez todas las entradas cacheadas con la versión anterior.
+    """
+    key = _analytics_version_key(distribuidor_id)
+
+    def incrementar():
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+    transaction.on_commit(incrementar)
+
+
+def _etag_lista(request, *args, **kwargs):
+    """
+    ETag del listado a partir de la última modificación de las relaciones del distribuidor y de
+    sus vendedores (nombre y correo se muestran en la tabla), más el número de relaciones.
+    El conteo cubre las eliminaciones, que no dejan rastro en fecha_actualizacion.
+    Con mensajes pendientes no hay ETag: un 304 dejaría sin mostrar el mensaje.
+    """
+    if not request.user.is_authenticated or len(messages.get_messages(request)):
+        return None
+    stats = DistribuidorVendedor.objects.filter(distribuidor_id=request.user.pk).aggregate(
+        ultima=models.Max('fecha_actualizacion'),
+        ultima_vendedor=models.Max('vendedor__last_updated'),
+        total=models.Count('pk'),
+    )
+    if stats['ultima'] is None:
+        return None
+    return f"{request.user.pk}-{stats['total']}-{stats['ultima'].timestamp()}-{stats['ultima_vendedor'].timestamp()}"
+
+class ConteoPaginator(Paginator):
+    """
+    Paginator que acepta el total de elementos ya conocido para omitir el SELECT COUNT(*).
+    """
+    def __init__(self, *args, count=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._count = count
+
+    @cached_property
+    def count(self):
+        if self._count is not None:
+            return self._count
+        return super().count
+
 class DistribuidorRequiredMixin(LoginRequiredMixin):
     """
     Mixin para restringir acceso a usuarios con rol 'distribuidor'.
@@ -47,7 +105,7 @@ class DistribuidorRequiredMixin(LoginRequiredMixin):
         if not request.user.is_authenticated:
             logger.warning(f"Intento de acceso no autenticado a {request.path}")
             return self.handle_no_permission()
-        if request.user.rol != 'distribuidor':
+        if not request.user.is_distribuidor:
             logger.warning(f"Acceso denegado para usuario {request.user.username} con rol {request.user.rol}")
             raise PermissionDenied(_("Acceso restringido a distribuidores."))
         return super().dispatch(request, *args, **kwargs)
@@ -55,68 +113,91 @@ class DistribuidorRequiredMixin(LoginRequiredMixin):
 class DistribuidorVendedorListView(DistribuidorRequiredMixin, ListView):
     """
     Vista para listar todos los vendedores asignados a un distribuidor.
-    Muestra el saldo real (wallet.balance) de cada vendedor, optimizado para evitar N+1 queries.
-    Incluye analíticas avanzadas y caching para grandes volúmenes.
+    Muestra el saldo de billetera de cada vendedor (copia de wallet.balance en saldo_wallet_cache), optimizado para evitar N+1 queries.
+    Incluye analíticas avanzadas y caching para grandes volúmenes; responde 304 si los datos
+    del distribuidor no han cambiado desde la última carga (ETag).
     """
-    model = DistribuidorVendedor
+    # Parte fija del queryset; get_queryset() solo añade el filtro del distribuidor
+    queryset = (
+        DistribuidorVendedor.objects
+        .select_related('vendedor')
+        .only(*LISTA_FIELDS)
+        .order_by('-fecha_creacion')
+    )
     template_name = 'vendedores/lista.html'
     context_object_name = 'relaciones'
     paginate_by = 25
+    paginate_orphans = 5
+    paginator_class = ConteoPaginator
 
-    @method_decorator(cache_page(60 * 5, key_prefix='vendedores_list_{{user.pk}}'))
     @method_decorator(vary_on_cookie)
+    @method_decorator(condition(etag_func=_etag_lista))
     def dispatch(self, *args, **kwargs):
         return super().dispatch(*args, **kwargs)
 
     def get_queryset(self):
         """
         Filtra relaciones por distribuidor con consultas optimizadas.
-        Incluye wallet.balance mediante select_related para evitar N+1 queries.
+        El balance de la billetera se lee de saldo_wallet_cache, sin unir la tabla wallet,
+        y con only() se proyectan únicamente las columnas que muestra la plantilla.
+        El queryset se memoriza en la instancia para no reconstruirlo en get_context_data.
+        """
+        if not hasattr(self, '_qs'):
+            self._active_ids = DistribuidorVendedor.get_active_ids_for(self.request.user.pk)
+            self._qs = super().get_queryset().filter(pk__in=self._active_ids)
+        return self._qs
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """
+        El total es el número de IDs activos cacheados: la paginación no ejecuta SELECT COUNT(*).
         """
-        return (
-            DistribuidorVendedor.objects.filter(
-                distribuidor=self.request.user,
-                activo=True
-            )
-            .select_related('vendedor', 'vendedor__wallet', 'creado_por')
-            .prefetch_related('change_logs')
-            .order_by('-fecha_creacion')
+        return super().get_paginator(
+            queryset, per_page, orphans=orphans, allow_empty_first_page=allow_empty_first_page,
+            count=len(self._active_ids), **kwargs
         )
 
     def get_context_data(self, **kwargs):
         """
         Añade analíticas y estadísticas al contexto, incluyendo saldo total disponible.
-        Usa caching para mejorar rendimiento en entornos de alta carga.
+        Las analíticas se cachean bajo una clave versionada por distribuidor; la agregación
+        (una sola consulta) solo se ejecuta cuando la versión vigente no está en caché.
         """
         context = super().get_context_data(**kwargs)
         queryset = self.get_queryset()
 
-        total_vendedores = queryset.count()
-        vendedores_activos = queryset.filter(activo=True).count()
-        saldo_total = queryset.aggregate(
-            total_saldo=models.Sum('saldo_disponible', output_field=models.DecimalField())
-        )['total_saldo'] or Decimal('0.00')
-
-        cache_key = f'vendedores_analytics_{self.request.user.pk}'
-        analytics = cache.get(cache_key)
-        if not analytics:
-            analytics = {
-                'ultima_creacion': queryset.first().fecha_creacion if total_vendedores > 0 else None,
-                'total_saldo': saldo_total,
-                'vendedores_activos_porcentaje': (
-                    (vendedores_activos / total_vendedores * 100) if total_vendedores > 0 else 0
-                ),
-            }
-            cache.set(cache_key, analytics, timeout=60 * 10)
+        version = cache.get(_analytics_version_key(self.request.user.pk), 0)
+        analytics = cache.get_or_set(
+            f'vend_analytics_v{version}_{self.request.user.pk}',
+            lambda: self._calcular_analytics(queryset),
+            ANALYTICS_CACHE_TIMEOUT
+        )
 
         context.update({
             'title': _("Lista de Vendedores"),
-            'total_vendedores': total_vendedores,
-            'vendedores_activos': vendedores_activos,
+            'total_vendedores': analytics['total_vendedores'],
+            'vendedores_activos': analytics['total_vendedores'],
             'analytics': analytics,
         })
         return context
 
+    @staticmethod
+    def _calcular_analytics(queryset):
+        """
+        Conteo, saldo total y última creación en una sola consulta de agregación.
+        """
+        stats = queryset.aggregate(
+            total=models.Count('pk'),
+            total_saldo=models.Sum('saldo_disponible'),
+            ultima_creacion=models.Max('fecha_creacion'),
+        )
+        # El queryset solo contiene relaciones activas: el total coincide con los activos.
+        return {
+            'total_vendedores': stats['total'],
+            'ultima_creacion': stats['ultima_creacion'],
+            'total_saldo': stats['total_saldo'] or Decimal('0.00'),
+            'vendedores_activos_porcentaje': 100 if stats['total'] > 0 else 0,
+        }
+
 class DistribuidorVendedorCreateView(DistribuidorRequiredMixin, CreateView):
     """
     Vista para crear un nuevo usuario vendedor y su relación con el distribuidor.
@@ -138,32 +219,14 @@ class DistribuidorVendedorCreateView(DistribuidorRequiredMixin, CreateView):
         """Crea un usuario vendedor y la relación en una transacción segura."""
         try:
             with transaction.atomic():
-                user = form.save(commit=False)
-                user.rol = 'vendedor'
-                user.save()
-
-                relacion = DistribuidorVendedor.objects.create(
-                    distribuidor=self.request.user,
-                    vendedor=user,
-                    saldo_inicial=Decimal('0.00'),
-                    saldo_asignado=Decimal('0.00'),
-                    saldo_disponible=Decimal('0.00'),
-                    moneda='MXN',
-                    direccion_contacto=form.cleaned_data.get('direccion', ''),
-                    telefono_contacto=form.cleaned_data.get('telefono', ''),
-                    correo_contacto=form.cleaned_data.get('email_contacto', ''),
-                    nombre_comercial=form.cleaned_data.get('nombre_comercial', f"{user.first_name} {user.last_name}".strip()),
-                    es_creado_directamente=True,
-                    creado_por=self.request.user,
-                    activo=True
-                )
+                user, relacion = create_vendedores(self.request.user, [form.cleaned_data])[0]
 
-                try:
-                    self.send_welcome_email(user, form.cleaned_data['password1'])
-                except Exception as email_error:
-                    logger.warning(f"No se pudo enviar el correo de bienvenida a {user.email}: {str(email_error)}")
-                    messages.warning(self.request, _("Vendedor creado, pero no se pudo enviar el correo de bienvenida."))
+                # El correo (plantillas + SMTP) se envía al confirmar, fuera de la transacción;
+                # si el alta se revierte no se envía nada.
+                password = form.cleaned_data['password1']
+                transaction.on_commit(lambda: self._enviar_bienvenida(user, password))
 
+                invalidar_analytics(self.request.user.pk)
                 logger.info(f"Vendedor {user.username} creado por distribuidor {self.request.user.username} con relación {relacion.pk}")
                 messages.success(self.request, _("Vendedor creado y asignado correctamente."))
                 return redirect(self.success_url)
@@ -171,6 +234,11 @@ class DistribuidorVendedorCreateView(DistribuidorRequiredMixin, CreateView):
             logger.error(f"Error de validación al crear vendedor: {str(e)}")
             messages.error(self.request, _("Error al crear el vendedor: ") + str(e))
             return self.form_invalid(form)
+        except IntegrityError as e:
+            # Carrera entre la validación y el INSERT: se traduce la violación UNIQUE al campo.
+            logger.warning(f"Violación de unicidad al crear vendedor: {str(e)}")
+            form.add_error(None, error_unicidad(e))
+            return self.form_invalid(form)
         except Exception as e:
             logger.error(f"Error inesperado al crear vendedor: {str(e)}")
             messages.error(self.request, _("Error inesperado: ") + str(e))
@@ -181,42 +249,29 @@ class DistribuidorVendedorCreateView(DistribuidorRequiredMixin, CreateView):
         messages.error(self.request, _("Por favor corrige los errores en el formulario."))
         return super().form_invalid(form)
 
+    def _enviar_bienvenida(self, user, password):
+        """Envía el correo de bienvenida sin propagar errores: el vendedor ya quedó creado."""
+        try:
+            self.send_welcome_email(user, password)
+        except Exception as email_error:
+            logger.warning(f"No se pudo enviar el correo de bienvenida a {user.email}: {str(email_error)}")
+            messages.warning(self.request, _("Vendedor creado, pero no se pudo enviar el correo de bienvenida."))
+
     def send_welcome_email(self, user, password):
         """Envía un correo de bienvenida al nuevo vendedor con credenciales."""
         if not user.email:
             raise ValueError(_("El usuario no tiene un correo electrónico válido."))
-        
-        subject = _("Bienvenido a MexaRed - Credenciales de Acceso")
-        context = {
-            'user': user,
-            'password': password,
-            'site_name': "MexaRed",
-            'login_url': self.request.build_absolute_uri(reverse_lazy('users:login')),
-            'distribuidor': self.request.user.full_name,
-            'support_email': settings.SUPPORT_EMAIL or settings.DEFAULT_FROM_EMAIL,
-        }
-        
-        try:
-            message = render_to_string('vendedores/emails/welcome_email.txt', context)
-            html_message = render_to_string('vendedores/emails/welcome_email.html', context)
-            send_mail(
-                subject,
-                message,
-                settings.DEFAULT_FROM_EMAIL,
-                [user.email],
-                html_message=html_message,
-                fail_silently=False
-            )
-            logger.info(f"Correo de bienvenida enviado a {user.email}")
-        except Exception as e:
-            logger.error(f"Error al enviar correo a {user.email}: {str(e)}")
-            raise
+        send_welcome_emails(
+            self.request.user,
+            [(user, password)],
+            self.request.build_absolute_uri(reverse_lazy('users:login')),
+        )
 
     def get_context_data(self, **kwargs):
         """Añade título y contexto adicional."""
         context = super().get_context_data(**kwargs)
         context['title'] = _("Crear Nuevo Vendedor")
-        context['form_id'] = f"create-vendedor-{uuid.uuid4().hex[:8]}"
+        context['form_id'] = "create-vendedor"
         return context
 
 class AsignarSaldoView(DistribuidorRequiredMixin, FormView):
@@ -228,32 +283,33 @@ class AsignarSaldoView(DistribuidorRequiredMixin, FormView):
     template_name = 'vendedores/formulario_asignar.html'
 
     def dispatch(self, request, *args, **kwargs):
+        # La propiedad se filtra en la consulta: una relación ajena responde 404 sin revelar que existe.
+        # El distribuidor es el usuario autenticado, así que no se une ni se vuelve a leer.
         self.relacion = get_object_or_404(
-            DistribuidorVendedor.objects.select_related('vendedor', 'distribuidor'),
-            pk=kwargs['pk']
+            DistribuidorVendedor.objects.select_related('vendedor'),
+            uuid=kwargs['uuid'],
+            distribuidor_id=request.user.pk
         )
-        if self.relacion.distribuidor != request.user:
-            logger.warning(f"Intento de acceso no autorizado por {request.user.username} a relación {self.relacion.pk}")
-            raise PermissionDenied(_("No tienes permiso para asignar saldo a este vendedor."))
+        self.relacion.distribuidor = request.user
         if not self.relacion.activo:
             messages.error(request, _("No puedes asignar saldo a un vendedor inactivo."))
             return redirect('vendedores:lista')
         return super().dispatch(request, *args, **kwargs)
 
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        kwargs['relacion'] = self.relacion
-        return kwargs
-
     def form_valid(self, form):
         try:
             with transaction.atomic():
                 monto = form.cleaned_data['monto']
-                self.relacion.asignar_saldo(
+                # Bloquea solo la fila de la relación (no las de usuarios unidas) y revalida su estado
+                relacion = DistribuidorVendedor.objects.select_for_update(of=('self',)).get(pk=self.relacion.pk)
+                if not relacion.activo:
+                    raise RelacionVendedorError(_("No puedes asignar saldo a un vendedor inactivo."), code='inactive')
+                relacion.asignar_saldo(
                     monto=monto,
                     moneda='MXN',
                     changed_by=self.request.user
                 )
+                invalidar_analytics(self.request.user.pk)
                 logger.info(
                     f"Saldo {monto} MXN asignado a vendedor "
                     f"{self.relacion.vendedor.username} por {self.request.user.username}"
@@ -273,7 +329,7 @@ class AsignarSaldoView(DistribuidorRequiredMixin, FormView):
         context = super().get_context_data(**kwargs)
         context['title'] = _("Asignar Saldo a ") + self.relacion.vendedor.full_name
         context['relacion'] = self.relacion
-        context['form_id'] = f"asignar-saldo-{uuid.uuid4().hex[:8]}"
+        context['form_id'] = "asignar-saldo"
         return context
 
 class DescontarSaldoView(DistribuidorRequiredMixin, FormView):
@@ -285,13 +341,14 @@ class DescontarSaldoView(DistribuidorRequiredMixin, FormView):
     template_name = 'vendedores/formulario_descontar.html'
 
     def dispatch(self, request, *args, **kwargs):
+        # La propiedad se filtra en la consulta: una relación ajena responde 404 sin revelar que existe.
+        # El distribuidor es el usuario autenticado, así que no se une ni se vuelve a leer.
         self.relacion = get_object_or_404(
-            DistribuidorVendedor.objects.select_related('vendedor', 'distribuidor'),
-            pk=kwargs['pk']
+            DistribuidorVendedor.objects.select_related('vendedor'),
+            uuid=kwargs['uuid'],
+            distribuidor_id=request.user.pk
         )
-        if self.relacion.distribuidor != request.user:
-            logger.warning(f"Intento de acceso no autorizado por {request.user.username} a relación {self.relacion.pk}")
-            raise PermissionDenied(_("No tienes permiso para descontar saldo de este vendedor."))
+        self.relacion.distribuidor = request.user
         if not self.relacion.activo:
             messages.error(request, _("No puedes descontar saldo de un vendedor inactivo."))
             return redirect('vendedores:lista')
@@ -306,11 +363,16 @@ class DescontarSaldoView(DistribuidorRequiredMixin, FormView):
         try:
             with transaction.atomic():
                 monto = form.cleaned_data['monto']
-                self.relacion.descontar_saldo(
+                # Bloquea solo la fila de la relación (no las de usuarios unidas) y revalida su estado
+                relacion = DistribuidorVendedor.objects.select_for_update(of=('self',)).get(pk=self.relacion.pk)
+                if not relacion.activo:
+                    raise RelacionVendedorError(_("No puedes descontar saldo de un vendedor inactivo."), code='inactive')
+                relacion.descontar_saldo(
                     monto=monto,
                     moneda='MXN',
                     changed_by=self.request.user
                 )
+                invalidar_analytics(self.request.user.pk)
                 logger.info(
                     f"Saldo {monto} MXN descontado de vendedor "
                     f"{self.relacion.vendedor.username} por {self.request.user.username}"
@@ -330,57 +392,55 @@ class DescontarSaldoView(DistribuidorRequiredMixin, FormView):
         context = super().get_context_data(**kwargs)
         context['title'] = _("Descontar Saldo de ") + self.relacion.vendedor.full_name
         context['relacion'] = self.relacion
-        context['form_id'] = f"descontar-saldo-{uuid.uuid4().hex[:8]}"
+        context['form_id'] = "descontar-saldo"
         return context
 
-class DistribuidorVendedorToggleActiveView(DistribuidorRequiredMixin, UpdateView):
+class DistribuidorVendedorToggleActiveView(DistribuidorRequiredMixin, TemplateView):
     """
-    Vista para activar o desactivar un vendedor.
-    Registra la acción en el log de auditoría.
+    Activa o desactiva un vendedor: GET muestra la confirmación y POST aplica el cambio.
     """
-    model = DistribuidorVendedor
-    fields = ['activo']
     template_name = 'vendedores/toggle_active.html'
 
     def dispatch(self, request, *args, **kwargs):
+        # La propiedad se filtra en la consulta: una relación ajena responde 404 sin revelar que existe.
+        # El distribuidor es el usuario autenticado, así que no se une ni se vuelve a leer.
         self.relacion = get_object_or_404(
-            DistribuidorVendedor.objects.select_related('vendedor', 'distribuidor'),
-            pk=kwargs['pk']
+            DistribuidorVendedor.objects.select_related('vendedor'),
+            uuid=kwargs['uuid'],
+            distribuidor_id=request.user.pk
         )
-        if self.relacion.distribuidor != request.user:
-            logger.warning(f"Intento de acceso no autorizado por {request.user.username} a relación {self.relacion.pk}")
-            raise PermissionDenied(_("No tienes permiso para modificar este vendedor."))
+        self.relacion.distribuidor = request.user
         return super().dispatch(request, *args, **kwargs)
 
-    def form_valid(self, form):
+    def post(self, request, *args, **kwargs):
+        """
+        Activa o desactiva el vendedor y vuelve al listado. Registra la acción en el log de auditoría.
+        """
+        relacion = self.relacion
         try:
             with transaction.atomic():
-                action = 'desactivado' if self.relacion.activo else 'reactivado'
-                if self.relacion.activo:
-                    self.relacion.desactivar(changed_by=self.request.user)
-                    messages.success(self.request, _("Vendedor desactivado correctamente."))
+                action = 'desactivado' if relacion.activo else 'reactivado'
+                if relacion.activo:
+                    relacion.desactivar(changed_by=request.user)
+                    messages.success(request, _("Vendedor desactivado correctamente."))
                 else:
-                    self.relacion.reactivar(changed_by=self.request.user)
-                    messages.success(self.request, _("Vendedor reactivado correctamente."))
+                    relacion.reactivar(changed_by=request.user)
+                    messages.success(request, _("Vendedor reactivado correctamente."))
+                invalidar_analytics(request.user.pk)
                 logger.info(
-                    f"Vendedor {self.relacion.vendedor.username} {action} por {self.request.user.username}"
+                    f"Vendedor {relacion.vendedor.username} {action} por {request.user.username}"
                 )
-                return redirect('vendedores:lista')
         except (ValueError, ValidationError) as e:
             logger.error(f"Error al cambiar estado del vendedor: {str(e)}")
-            messages.error(self.request, str(e))
-            return self.form_invalid(form)
-
-    def form_invalid(self, form):
-        messages.error(self.request, _("Por favor corrige los errores en el formulario."))
-        return super().form_invalid(form)
+            messages.error(request, str(e))
+        return redirect('vendedores:lista')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['title'] = _("Cambiar Estado de ") + self.relacion.vendedor.full_name
         context['relacion'] = self.relacion
         context['action'] = _("Desactivar") if self.relacion.activo else _("Reactivar")
-        context['form_id'] = f"toggle-active-{uuid.uuid4().hex[:8]}"
+        context['form_id'] = "toggle-active"
         return context
 
 class DistribuidorVendedorUpdateView(DistribuidorRequiredMixin, UpdateView):
@@ -393,11 +453,19 @@ class DistribuidorVendedorUpdateView(DistribuidorRequiredMixin, UpdateView):
     form_class = DistribuidorVendedorForm
     template_name = 'vendedores/formulario_editar.html'
     success_url = reverse_lazy('vendedores:lista')
+    slug_field = 'uuid'
+    slug_url_kwarg = 'uuid'
 
     def get_queryset(self):
         return DistribuidorVendedor.objects.filter(
             distribuidor=self.request.user
-        ).select_related('vendedor', 'distribuidor')
+        ).select_related('vendedor')
+
+    def get_object(self, queryset=None):
+        # El distribuidor es el usuario autenticado: se asigna sin volver a leerlo
+        obj = super().get_object(queryset)
+        obj.distribuidor = self.request.user
+        return obj
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
@@ -427,5 +495,5 @@ class DistribuidorVendedorUpdateView(DistribuidorRequiredMixin, UpdateView):
         context = super().get_context_data(**kwargs)
         context['title'] = _("Editar Vendedor ") + self.object.vendedor.full_name
         context['boton'] = _("Actualizar")
-        context['form_id'] = f"edit-vendedor-{uuid.uuid4().hex[:8]}"
+        context['form_id'] = "edit-vendedor"
         return context
\ No newline at end of file
@@ -9,23 +9,90 @@ Uses only @admin.register to avoid AlreadyRegistered errors.
 
 import logging
 from django.contrib import admin
+from django.contrib.admin.views.autocomplete import AutocompleteJsonView
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.admin.widgets import AutocompleteSelect
 from django import forms
 from django.contrib import messages
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from django.shortcuts import render, redirect
 from django.db import transaction
-from django.urls import reverse
+from django.urls import path, reverse
+from django.utils.functional import cached_property
 from decimal import Decimal
+from functools import cache, partial
 from apps.wallet.models import Wallet, WalletMovement
-from apps.wallet.enums import TipoMovimiento
 from apps.wallet.services import WalletService
-from apps.users.models import User, ROLE_ADMIN, ROLE_DISTRIBUIDOR, ROLE_VENDEDOR, ROLE_CLIENTE, UserChangeLog
+from apps.users.models import User, ROLE_ADMIN, ROLE_DISTRIBUIDOR, ROLE_VENDEDOR, ROLE_CLIENTE, ROLE_CHOICES, UserChangeLog
 from apps.wallet.exceptions import WalletException
 
 # Configuración avanzada de logging para auditoría empresarial
 logger = logging.getLogger(__name__)
 
+# Etiquetas de rol por valor almacenado, para las columnas de usuario de los listados
+_ROL_LABELS = dict(ROLE_CHOICES)
+
+
+def _auditar_al_confirmar(**campos):
+    """
+    Registra el UserChangeLog de una operación de billetera cuando su transacción se confirma,
+    fuera del bloqueo de la fila. Es robusto: si la inserción falla se registra el error y la
+    operación ya confirmada no se reporta como fallida. Si la transacción se revierte, no se escribe.
+    """
+    transaction.on_commit(partial(UserChangeLog.objects.create, **campos), robust=True)
+
+
+@cache
+def _user_changelist_url():
+    """
+    URL del listado de usuarios en el admin, resuelta una sola vez con el URLconf cargado.
+    """
+    return reverse('admin:users_user_changelist')
+
+
+def _enlace_usuario(user_id, etiqueta):
+    """
+    Enlace a la ficha de edición del usuario en el admin.
+    """
+    return format_html('<a href="{}{}/change/">{}</a>', _user_changelist_url(), user_id, etiqueta)
+
+class ProyeccionChangeList(ChangeList):
+    """
+    ChangeList que lee solo las columnas declaradas en ModelAdmin.list_only.
+    El detalle (get_queryset del ModelAdmin) sigue cargando los registros completos.
+    """
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return (
+            queryset.select_related(None)
+            .select_related(*self.list_select_related)
+            .only(*self.model_admin.list_only)
+        )
+
+# Usuarios que pueden recibir una transferencia desde el admin
+DESTINO_TRANSFERENCIA = {'rol__in': [ROLE_VENDEDOR, ROLE_CLIENTE], 'is_active': True, 'wallet__isnull': False}
+
+class DestinoAutocompleteView(AutocompleteJsonView):
+    """
+    Búsqueda paginada de usuarios destino para TransferenciaAdminForm.
+    Usa los search_fields de UserAdmin y ofrece solo los usuarios que pueden recibir transferencias.
+    """
+    def get_queryset(self):
+        return super().get_queryset().filter(**DESTINO_TRANSFERENCIA)
+
+class DestinoAutocompleteSelect(AutocompleteSelect):
+    """
+    Selector con búsqueda en servidor: solo se renderiza la opción elegida, no todos los usuarios.
+    """
+    url_name = '%s:wallet_wallet_destino_autocomplete'
+
+# Atributos compartidos por los widgets de los formularios de acción (los widgets copian attrs)
+_WIDGET_ATTRS = {
+    'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
+}
+_MONTO_WIDGET_ATTRS = {**_WIDGET_ATTRS, 'placeholder': _("Ejemplo: 1000.00"), 'step': '0.01'}
+
 class RecargaAdminForm(forms.Form):
     """
     Formulario para recargar saldo a una billetera desde el Django Admin.
@@ -38,45 +105,29 @@ class RecargaAdminForm(forms.Form):
         min_value=Decimal('0.01'),
         max_value=Decimal('1000000.00'),
         help_text=_("Monto en MXN a acreditar en la billetera (mínimo 0.01, máximo 1,000,000)."),
-        widget=forms.NumberInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: 1000.00"),
-            'step': '0.01',
-        })
+        widget=forms.NumberInput(attrs=_MONTO_WIDGET_ATTRS)
     )
     referencia = forms.CharField(
         label=_("Referencia externa (opcional)"),
         max_length=255,
         required=False,
         help_text=_("Identificador externo, e.g., ID de transacción MercadoPago."),
-        widget=forms.TextInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: MP-1234567890"),
-        })
+        widget=forms.TextInput(attrs={**_WIDGET_ATTRS, 'placeholder': _("Ejemplo: MP-1234567890")})
     )
 
-    def clean(self):
-        """
-        Valida la integridad de los datos de entrada.
-        """
-        cleaned_data = super().clean()
-        referencia = cleaned_data.get('referencia')
-        if referencia and not referencia.strip():
-            raise forms.ValidationError(_("La referencia no puede estar vacía si se proporciona."), code='empty_referencia')
-        return cleaned_data
-
 class TransferenciaAdminForm(forms.Form):
     """
     Formulario para transferir saldo entre billeteras desde el Django Admin.
     Usado en la acción administrativa 'transferir_saldo' para superusuarios.
     """
     destino = forms.ModelChoiceField(
-        queryset=User.objects.filter(rol__in=[ROLE_VENDEDOR, ROLE_CLIENTE], is_active=True).select_related('wallet'),
+        queryset=None,  # Se asigna en __init__
         label=_("Usuario Destino"),
         help_text=_("Selecciona el usuario al que deseas transferir saldo (Vendedor o Cliente activo)."),
-        widget=forms.Select(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-        })
+        error_messages={
+            'invalid_choice': _("El usuario destino no es válido o no tiene una billetera asociada."),
+        },
+        widget=DestinoAutocompleteSelect(Wallet._meta.get_field('user'), admin.site, attrs=_WIDGET_ATTRS)
     )
     monto = forms.DecimalField(
         label=_("Monto a transferir (MXN)"),
@@ -85,42 +136,28 @@ class TransferenciaAdminForm(forms.Form):
         min_value=Decimal('0.01'),
         max_value=Decimal('1000000.00'),
         help_text=_("Monto en MXN a transferir (mínimo 0.01, máximo 1,000,000)."),
-        widget=forms.NumberInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: 1000.00"),
-            'step': '0.01',
-        })
+        widget=forms.NumberInput(attrs=_MONTO_WIDGET_ATTRS)
     )
     referencia = forms.CharField(
         label=_("Referencia (opcional)"),
         max_length=255,
         required=False,
         help_text=_("Identificador externo, e.g., ID de transacción interna."),
-        widget=forms.TextInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: TX-1234567890"),
-        })
+        widget=forms.TextInput(attrs={**_WIDGET_ATTRS, 'placeholder': _("Ejemplo: TX-1234567890")})
     )
 
-    def clean(self):
-        """
-        Valida la integridad de los datos de entrada.
-        """
-        cleaned_data = super().clean()
-        monto = cleaned_data.get('monto')
-        referencia = cleaned_data.get('referencia')
-        destino = cleaned_data.get('destino')
-
-        if referencia and not referencia.strip():
-            raise forms.ValidationError(_("La referencia no puede estar vacía si se proporciona."), code='empty_referencia')
-        if destino:
-            try:
-                destino.wallet
-            except Wallet.DoesNotExist:
-                raise forms.ValidationError(
-                    _("El usuario destino no tiene una billetera asociada."), code='no_wallet_destino'
-                )
-        return cleaned_data
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Valida el destino elegido y renderiza su opción: id, username y rol, con la wallet en el mismo
+        # JOIN (hierarchy_root para la validación jerárquica). Solo se aceptan usuarios con billetera.
+        destino = self.fields['destino']
+        destino.queryset = (
+            User.objects.filter(**DESTINO_TRANSFERENCIA)
+            .select_related('wallet')
+            .only('id', 'username', 'rol', 'wallet__id', 'wallet__hierarchy_root')
+            .order_by('username')
+        )
+        destino.label_from_instance = lambda user: f"{user.username} ({_ROL_LABELS.get(user.rol, user.rol)})"
 
 @admin.register(Wallet)
 class WalletAdmin(admin.ModelAdmin):
@@ -131,11 +168,17 @@ class WalletAdmin(admin.ModelAdmin):
     """
     list_display = ('user_display', 'balance_display', 'blocked_balance_display', 'hierarchy_root_display', 'last_updated')
     search_fields = ('user__username', 'user__email', 'user__first_name', 'user__last_name')
-    list_filter = ('user__rol',)
+    list_filter = ('user_rol',)
     readonly_fields = ('user', 'hierarchy_root', 'balance', 'blocked_balance', 'last_updated')
     ordering = ('-last_updated',)
     list_per_page = 50
-    list_select_related = ('user', 'hierarchy_root')
+    # El usuario se muestra desde la copia user_username/user_rol: el listado no une la tabla de usuarios
+    # para el dueño de la billetera (las acciones cargan wallet.user completo al usarlo).
+    list_select_related = ('hierarchy_root',)
+    list_only = (
+        'user', 'user_username', 'user_rol', 'balance', 'blocked_balance', 'last_updated',
+        'hierarchy_root__id', 'hierarchy_root__username', 'hierarchy_root__rol',
+    )
     actions = ['recargar_saldo', 'transferir_saldo']
 
     def get_queryset(self, request):
@@ -144,14 +187,47 @@ class WalletAdmin(admin.ModelAdmin):
         """
         return super().get_queryset(request).select_related('user', 'hierarchy_root')
 
+    def get_changelist(self, request, **kwargs):
+        return ProyeccionChangeList
+
+    def get_urls(self):
+        urls = [
+            path(
+                'destino-autocomplete/',
+                self.admin_site.admin_view(DestinoAutocompleteView.as_view(admin_site=self.admin_site)),
+                name='wallet_wallet_destino_autocomplete',
+            ),
+        ]
+        return urls + super().get_urls()
+
+    @cached_property
+    def _static_admin_context(self):
+        """
+        Parte del contexto de las acciones que no depende de la petición.
+        """
+        return {
+            'opts': self.model._meta,
+            'app_label': self.model._meta.app_label,
+            'site_title': self.admin_site.site_title,
+            'site_url': '/',
+        }
+
+    def _admin_context(self, request, **context):
+        """
+        Contexto de las plantillas de acción: datos propios, parte estática y each_context del sitio,
+        calculado una sola vez por petición.
+        """
+        each_context = getattr(request, '_wallet_admin_ctx', None)
+        if each_context is None:
+            each_context = request._wallet_admin_ctx = self.admin_site.each_context(request)
+        return {**context, **self._static_admin_context, **each_context}
+
     @admin.display(description=_("Usuario"))
     def user_display(self, obj):
         """
         Muestra el username y rol del usuario con enlace seguro al perfil.
         """
-        name = obj.user.username
-        rol = obj.user.get_rol_display()
-        return format_html('<a href="/admin/users/user/{}/change/">{} ({})</a>', obj.user.id, name, rol)
+        return _enlace_usuario(obj.user_id, f"{obj.user_username} ({_ROL_LABELS.get(obj.user_rol, obj.user_rol)})")
 
     @admin.display(description=_("Saldo disponible"))
     def balance_display(self, obj):
@@ -172,36 +248,47 @@ class WalletAdmin(admin.ModelAdmin):
         """
         Muestra el username y rol del hierarchy_root, o '-' si no existe.
         """
-        if obj.hierarchy_root:
-            name = obj.hierarchy_root.username
-            rol = obj.hierarchy_root.get_rol_display()
-            return format_html('<a href="/admin/users/user/{}/change/">{} ({})</a>', obj.hierarchy_root.id, name, rol)
+        root = obj.hierarchy_root
+        if root:
+            return _enlace_usuario(root.pk, f"{root.username} ({_ROL_LABELS.get(root.rol, root.rol)})")
         return "-"
 
     def has_add_permission(self, request):
         """
         Permite creación manual solo para superusuarios.
+        Django consulta los permisos al renderizar cada página y fila, por eso el registro
+        de intentos se hace en las vistas (add_view, change_view, delete_view).
         """
-        if request.user.is_superuser:
-            logger.info(f"Permiso de creación de billetera concedido a {request.user.username}")
-            return True
-        logger.warning(f"Intento de creación de billetera denegado para {request.user.username}")
-        return False
+        return request.user.is_superuser
 
     def has_change_permission(self, request, obj=None):
         """
         Deshabilita edición directa para proteger integridad financiera.
         """
-        logger.warning(f"Intento de edición de billetera denegado para {request.user.username}")
         return False
 
     def has_delete_permission(self, request, obj=None):
         """
         Deshabilita eliminación para mantener trazabilidad.
         """
-        logger.warning(f"Intento de eliminación de billetera denegado para {request.user.username}")
         return False
 
+    def add_view(self, request, form_url='', extra_context=None):
+        if request.user.is_superuser:
+            logger.info("Permiso de creación de billetera concedido a %s", request.user.username)
+        else:
+            logger.warning("Intento de creación de billetera denegado para %s", request.user.username)
+        return super().add_view(request, form_url, extra_context)
+
+    def change_view(self, request, object_id, form_url='', extra_context=None):
+        if request.method == 'POST':
+            logger.warning("Intento de edición de billetera denegado para %s", request.user.username)
+        return super().change_view(request, object_id, form_url, extra_context)
+
+    def delete_view(self, request, object_id, extra_context=None):
+        logger.warning("Intento de eliminación de billetera denegado para %s", request.user.username)
+        return super().delete_view(request, object_id, extra_context)
+
     @admin.action(description=_("Recargar saldo seleccionado"))
     def recargar_saldo(self, request, queryset):
         """
@@ -209,18 +296,29 @@ class WalletAdmin(admin.ModelAdmin):
         Restringida a superusuarios con rol ROLE_ADMIN, usa WalletService.deposit para trazabilidad.
         """
         if not request.user.is_superuser or request.user.rol != ROLE_ADMIN:
-            logger.warning(f"Intento de recarga denegado para {request.user.username} (no superusuario o no ROLE_ADMIN)")
+            logger.warning(
+                "Intento de recarga denegado para %s (no superusuario o no ROLE_ADMIN)",
+                request.user.username
+            )
             messages.error(request, _("Solo administradores pueden realizar recargas."))
             return
 
-        if queryset.count() != 1:
-            logger.warning(f"Selección inválida para recarga por {request.user.username}: {queryset.count()} billeteras")
+        # LIMIT 2 basta para saber si hay exactamente una y ya trae la fila que se usará
+        wallets = list(queryset[:2])
+        if len(wallets) != 1:
+            logger.warning(
+                "Selección inválida para recarga por %s: %s billeteras",
+                request.user.username, '2+' if wallets else 0
+            )
             messages.warning(request, _("Selecciona solo una billetera para recargar."))
             return
 
-        wallet = queryset.first()
+        wallet = wallets[0]
         if wallet.user.rol != ROLE_DISTRIBUIDOR:
-            logger.warning(f"Intento de recarga a billetera no Distribuidor por {request.user.username}: {wallet.user.rol}")
+            logger.warning(
+                "Intento de recarga a billetera no Distribuidor por %s: %s",
+                request.user.username, wallet.user.rol
+            )
             messages.error(request, _("Solo se puede recargar a billeteras de Distribuidores."))
             return
 
@@ -240,8 +338,8 @@ class WalletAdmin(admin.ModelAdmin):
                             device_info=request.META.get('HTTP_USER_AGENT', 'Django Admin'),
                             moneda_codigo='MXN'
                         )
-                        # Registrar auditoría adicional
-                        UserChangeLog.objects.create(
+                        # Auditoría adicional después del commit, sin alargar el bloqueo de la billetera
+                        _auditar_al_confirmar(
                             user=wallet.user,
                             changed_by=request.user,
                             change_type='update',
@@ -253,8 +351,8 @@ class WalletAdmin(admin.ModelAdmin):
                             }
                         )
                         logger.info(
-                            f"Recarga exitosa por {request.user.username}: {monto} MXN a {wallet.user.username} "
-                            f"(wallet_id: {wallet.id}, referencia: {referencia or 'N/A'})"
+                            "Recarga exitosa por %s: %s MXN a %s (wallet_id: %s, referencia: %s)",
+                            request.user.username, monto, wallet.user.username, wallet.id, referencia or 'N/A'
                         )
                         messages.success(
                             request,
@@ -263,35 +361,32 @@ class WalletAdmin(admin.ModelAdmin):
                         return redirect("admin:wallet_wallet_changelist")
                     except WalletException as e:
                         logger.error(
-                            f"Error en recarga por {request.user.username} para {wallet.user.username}: {str(e)}",
+                            "Error en recarga por %s para %s: %s",
+                            request.user.username, wallet.user.username, e,
                             exc_info=True
                         )
                         messages.error(request, _("Error al recargar saldo: %(error)s") % {'error': str(e)})
                     except Exception as e:
                         logger.error(
-                            f"Error inesperado en recarga por {request.user.username} para {wallet.user.username}: {str(e)}",
+                            "Error inesperado en recarga por %s para %s: %s",
+                            request.user.username, wallet.user.username, e,
                             exc_info=True
                         )
                         messages.error(request, _("Error inesperado al procesar la operación."))
             else:
-                logger.debug(f"Formulario de recarga inválido para {request.user.username}: {form.errors}")
+                logger.debug("Formulario de recarga inválido para %s: %s", request.user.username, form.errors)
                 messages.error(request, _("Por favor corrige los errores en el formulario."))
         else:
             form = RecargaAdminForm()
 
-        context = {
-            'form': form,
-            'wallet': wallet,
-            'title': _("Recargar Saldo"),
-            'action': 'recargar_saldo',
-            'opts': self.model._meta,
-            'app_label': self.model._meta.app_label,
-            'cl': self.get_changelist_instance(request),
-            'site_title': admin.site.site_title,
-            'site_url': '/',
-            'has_view_permission': self.has_view_permission(request, wallet),
-        }
-        context.update(self.admin_site.each_context(request))
+        context = self._admin_context(
+            request,
+            form=form,
+            wallet=wallet,
+            title=_("Recargar Saldo"),
+            action='recargar_saldo',
+            has_view_permission=self.has_view_permission(request, wallet),
+        )
         return render(request, "admin/wallet/recargar_saldo.html", context)
 
     @admin.action(description=_("Transferir saldo seleccionado"))
@@ -301,18 +396,28 @@ class WalletAdmin(admin.ModelAdmin):
         Restringida a superusuarios con rol ROLE_ADMIN, usa WalletService.transfer para validar jerarquía.
         """
         if not request.user.is_superuser or request.user.rol != ROLE_ADMIN:
-            logger.warning(f"Intento de transferencia denegado para {request.user.username} (no superusuario o no ROLE_ADMIN)")
+            logger.warning(
+                "Intento de transferencia denegado para %s (no superusuario o no ROLE_ADMIN)",
+                request.user.username
+            )
             messages.error(request, _("Solo administradores pueden realizar transferencias."))
             return
 
-        if queryset.count() != 1:
-            logger.warning(f"Selección inválida para transferencia por {request.user.username}: {queryset.count()} billeteras")
+        wallets = list(queryset[:2])
+        if len(wallets) != 1:
+            logger.warning(
+                "Selección inválida para transferencia por %s: %s billeteras",
+                request.user.username, '2+' if wallets else 0
+            )
             messages.warning(request, _("Selecciona solo una billetera origen para transferir."))
             return
 
-        origen_wallet = queryset.first()
+        origen_wallet = wallets[0]
         if origen_wallet.user.rol != ROLE_DISTRIBUIDOR:
-            logger.warning(f"Intento de transferencia desde billetera no Distribuidor por {request.user.username}: {origen_wallet.user.rol}")
+            logger.warning(
+                "Intento de transferencia desde billetera no Distribuidor por %s: %s",
+                request.user.username, origen_wallet.user.rol
+            )
             messages.error(request, _("Solo se permite transferir desde billeteras de Distribuidores."))
             return
 
@@ -335,8 +440,8 @@ class WalletAdmin(admin.ModelAdmin):
                             actor_ip=request.META.get('REMOTE_ADDR', 'unknown'),
                             device_info=request.META.get('HTTP_USER_AGENT', 'Django Admin')
                         )
-                        # Registrar auditoría adicional
-                        UserChangeLog.objects.create(
+                        # Auditoría adicional después del commit, sin alargar el bloqueo de las billeteras
+                        _auditar_al_confirmar(
                             user=destino_user,
                             changed_by=request.user,
                             change_type='update',
@@ -349,8 +454,8 @@ class WalletAdmin(admin.ModelAdmin):
                             }
                         )
                         logger.info(
-                            f"Transferencia exitosa por {request.user.username}: {monto} MXN de {origen_wallet.user.username} "
-                            f"a {destino_user.username} (referencia: {referencia or 'N/A'})"
+                            "Transferencia exitosa por %s: %s MXN de %s a %s (referencia: %s)",
+                            request.user.username, monto, origen_wallet.user.username, destino_user.username, referencia or 'N/A'
                         )
                         messages.success(
                             request,
@@ -362,37 +467,33 @@ class WalletAdmin(admin.ModelAdmin):
                         return redirect("admin:wallet_wallet_changelist")
                     except WalletException as e:
                         logger.error(
-                            f"Error en transferencia por {request.user.username} de {origen_wallet.user.username} "
-                            f"a {destino_user.username}: {str(e)}",
+                            "Error en transferencia por %s de %s a %s: %s",
+                            request.user.username, origen_wallet.user.username, destino_user.username, e,
                             exc_info=True
                         )
                         messages.error(request, _("Error en transferencia: %(error)s") % {'error': str(e)})
                     except Exception as e:
                         logger.error(
-                            f"Error inesperado en transferencia por {request.user.username} de {origen_wallet.user.username} "
-                            f"a {destino_user.username}: {str(e)}",
+                            "Error inesperado en transferencia por %s de %s a %s: %s",
+                            request.user.username, origen_wallet.user.username, destino_user.username, e,
                             exc_info=True
                         )
                         messages.error(request, _("Error inesperado al procesar la operación."))
             else:
-                logger.debug(f"Formulario de transferencia inválido para {request.user.username}: {form.errors}")
+                logger.debug("Formulario de transferencia inválido para %s: %s", request.user.username, form.errors)
                 messages.error(request, _("Por favor corrige los errores en el formulario."))
         else:
             form = TransferenciaAdminForm()
 
-        context = {
-            'form': form,
-            'origen_wallet': origen_wallet,
-            'title': _("Transferir Saldo"),
-            'action': 'transferir_saldo',
-            'opts': self.model._meta,
-            'app_label': self.model._meta.app_label,
-            'cl': self.get_changelist_instance(request),
-            'site_title': admin.site.site_title,
-            'site_url': '/',
-            'has_view_permission': self.has_view_permission(request, origen_wallet),
-        }
-        context.update(self.admin_site.each_context(request))
+        context = self._admin_context(
+            request,
+            form=form,
+            origen_wallet=origen_wallet,
+            title=_("Transferir Saldo"),
+            action='transferir_saldo',
+            media=self.media + form.media,
+            has_view_permission=self.has_view_permission(request, origen_wallet),
+        )
         return render(request, "admin/wallet/transferir_saldo.html", context)
 
 @admin.register(WalletMovement)
@@ -403,7 +504,8 @@ class WalletMovementAdmin(admin.ModelAdmin):
     """
     list_display = ('short_id', 'wallet_display', 'tipo_display', 'monto_display', 'referencia', 'conciliado_display', 'fecha')
     search_fields = ('wallet__user__username', 'wallet__user__email', 'referencia', 'operacion_id')
-    list_filter = ('tipo', 'conciliado', 'fecha')
+    # tipo y conciliado se filtran desde sus choices (sin consulta); la fecha la cubre date_hierarchy
+    list_filter = ('tipo', 'conciliado')
     readonly_fields = (
         'wallet', 'tipo', 'monto', 'referencia', 'operacion_id',
         'fecha', 'creado_por', 'actor_ip', 'device_info', 'origen_wallet',
@@ -412,7 +514,11 @@ class WalletMovementAdmin(admin.ModelAdmin):
     ordering = ('-fecha',)
     list_per_page = 50
     date_hierarchy = 'fecha'
-    list_select_related = ('wallet__user', 'creado_por', 'origen_wallet__user')
+    list_select_related = ('wallet',)
+    list_only = (
+        'tipo', 'monto', 'referencia', 'conciliado', 'fecha',
+        'wallet__id', 'wallet__user', 'wallet__user_username',
+    )
 
     def get_queryset(self, request):
         """
@@ -420,6 +526,9 @@ class WalletMovementAdmin(admin.ModelAdmin):
         """
         return super().get_queryset(request).select_related('wallet__user', 'creado_por', 'origen_wallet__user')
 
+    def get_changelist(self, request, **kwargs):
+        return ProyeccionChangeList
+
     @admin.display(description=_("ID Movimiento"))
     def short_id(self, obj):
         """
@@ -432,19 +541,14 @@ class WalletMovementAdmin(admin.ModelAdmin):
         """
         Muestra el username de la billetera con enlace seguro al perfil.
         """
-        name = obj.wallet.user.username
-        return format_html('<a href="/admin/users/user/{}/change/">{}</a>', obj.wallet.user.id, name)
+        return _enlace_usuario(obj.wallet.user_id, obj.wallet.user_username)
 
     @admin.display(description=_("Tipo"))
     def tipo_display(self, obj):
         """
-        Muestra el tipo de movimiento traducido con manejo de excepciones.
+        Muestra el tipo de movimiento traducido a partir de las opciones del campo.
         """
-        try:
-            return TipoMovimiento[obj.tipo].label
-        except KeyError:
-            logger.warning(f"Tipo de movimiento inválido para ID {obj.id}: {obj.tipo}")
-            return _("Desconocido")
+        return obj.get_tipo_display()
 
     @admin.display(description=_("Monto"))
     def monto_display(self, obj):
@@ -463,20 +567,31 @@ class WalletMovementAdmin(admin.ModelAdmin):
     def has_add_permission(self, request):
         """
         Deshabilita creación manual de movimientos.
+        Los intentos se registran en las vistas, no en cada consulta de permisos al renderizar.
         """
-        logger.warning(f"Intento de creación de movimiento denegado para {request.user.username}")
         return False
 
     def has_change_permission(self, request, obj=None):
         """
         Deshabilita edición de movimientos para proteger integridad financiera.
         """
-        logger.warning(f"Intento de edición de movimiento denegado para {request.user.username}")
         return False
 
     def has_delete_permission(self, request, obj=None):
         """
         Deshabilita eliminación de movimientos para mantener trazabilidad.
         """
-        logger.warning(f"Intento de eliminación de movimiento denegado para {request.user.username}")
-        return False
\ No newline at end of file
+        return False
+
+    def add_view(self, request, form_url='', extra_context=None):
+        logger.warning("Intento de creación de movimiento denegado para %s", request.user.username)
+        return super().add_view(request, form_url, extra_context)
+
+    def change_view(self, request, object_id, form_url='', extra_context=None):
+        if request.method == 'POST':
+            logger.warning("Intento de edición de movimiento denegado para %s", request.user.username)
+        return super().change_view(request, object_id, form_url, extra_context)
+
+    def delete_view(self, request, object_id, extra_context=None):
+        logger.warning("Intento de eliminación de movimiento denegado para %s", request.user.username)
+        return super().delete_view(request, object_id, extra_context)
\ No newline at end of file
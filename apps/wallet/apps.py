@@ -12,6 +12,9 @@ class WalletConfig(AppConfig):
     name = 'apps.wallet'
     verbose_name = _("Sistema de Billeteras Financieras (Wallet Module)")
 
+    # Bases de datos en las que este proceso ya confirmó la moneda MXN
+    _mxn_ensured = set()
+
     def ready(self):
         post_migrate.connect(self.ensure_mxn_currency, sender=self)
 
@@ -19,18 +22,39 @@ class WalletConfig(AppConfig):
         """
         Garantiza que la moneda MXN exista después de cada migración.
         Implementación robusta, segura, atómica y auditada.
+        Si el proceso ya la confirmó en esa base de datos, los migrate posteriores que no tocan
+        migraciones de wallet no consultan. flush también emite post_migrate (sin plan) y en ese
+        caso siempre se vuelve a validar.
         """
+        using = kwargs.get('using', 'default')
+        plan = kwargs.get('plan')
+        if (
+            using in self._mxn_ensured
+            and plan is not None
+            and not any(migration.app_label == self.label for migration, _backwards in plan)
+        ):
+            return
+
         try:
-            Moneda = apps.get_model('wallet', 'Moneda')
+            Moneda = getattr(self, '_moneda_model', None)
+            if Moneda is None:
+                Moneda = self._moneda_model = apps.get_model('wallet', 'Moneda')
             if not Moneda:
                 logger.critical("❌ No se pudo localizar el modelo Moneda en apps.wallet", exc_info=True)
                 return
 
-            with transaction.atomic():
-                obj, created = Moneda.objects.get_or_create(
+            # Caso habitual: MXN ya existe y basta una consulta, sin abrir transacción
+            if Moneda.objects.using(using).filter(codigo="MXN").exists():
+                self._mxn_ensured.add(using)
+                logger.info("Moneda MXN ya existe. Validación pasada correctamente.")
+                return
+
+            with transaction.atomic(using=using):
+                obj, created = Moneda.objects.using(using).get_or_create(
                     codigo="MXN",
                     defaults={'nombre': "Peso Mexicano"}
                 )
+            self._mxn_ensured.add(using)
 
             if created:
                 logger.info("Moneda MXN creada automáticamente tras migración.")
@@ -38,6 +62,6 @@ class WalletConfig(AppConfig):
                 logger.info("Moneda MXN ya existe. Validación pasada correctamente.")
 
         except IntegrityError as e:
-            logger.error(f"Error de integridad al crear la moneda MXN: {e}", exc_info=True)
+            logger.error("Error de integridad al crear la moneda MXN: %s", e, exc_info=True)
         except Exception as e:
-            logger.critical(f"Error inesperado al validar la moneda MXN: {e}", exc_info=True)
+            logger.critical("Error inesperado al validar la moneda MXN: %s", e, exc_info=True)
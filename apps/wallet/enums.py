@@ -5,45 +5,27 @@ Diseñado para ser robusto, traducible y compatible con auditorías financieras
 Proporciona validaciones estrictas y soporte para UI/admin en múltiples idiomas.
 """
 
-from enum import Enum
+from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-class TipoMovimiento(Enum):
+class TipoMovimiento(models.TextChoices):
     """
     Enumerador que define los tipos de movimientos financieros para WalletMovement.
-    Las claves (name) se almacenan en la base de datos (WalletMovement.tipo).
-    Los valores (value) son textos legibles para interfaces de usuario y auditorías.
+    El valor (igual al nombre del miembro) se almacena en la base de datos (WalletMovement.tipo).
+    La etiqueta es el texto legible para interfaces de usuario y auditorías.
+    TextChoices expone .values, .labels y .choices ya calculados al definir la clase.
     """
-    CREDITO = _("Crédito")
-    DEBITO = _("Débito")
-    AJUSTE_POSITIVO = _("Ajuste Positivo")
-    AJUSTE_NEGATIVO = _("Ajuste Negativo")
-    TRANSFERENCIA_INTERNA = _("Transferencia Interna")
-    BLOQUEO = _("Bloqueo de Fondos")
-    DESBLOQUEO = _("Desbloqueo de Fondos")
-    REEMBOLSO = _("Reembolso")
-    RETIRO = _("Retiro")
-    COMPRA_EXTERNA = _("Compra Externa (MercadoPago)")
-    CARGO_EXTERNO = _("Cargo Externo (API, Addinteli)")
-    BONO_PROMOCIONAL = _("Bono Promocional")
-    AJUSTE_MANUAL = _("Ajuste Manual Admin")
-    CONCILIACION_BANCARIA = _("Conciliación Bancaria")
-
-    @classmethod
-    def values(cls):
-        """
-        Devuelve una lista de los nombres (claves) de los tipos de movimiento.
-        Utilizado para validaciones en WalletMovement.clean().
-        """
-        return [item.name for item in cls]
-
-    @classmethod
-    def choices(cls):
-        """
-        Devuelve una lista de tuplas (name, value) para usar en campos CharField de Django.
-        Convierte explícitamente el valor a str para garantizar compatibilidad con Django ORM.
-        Facilita la integración con formularios, admin y serializadores.
-        """
-        return [(item.name, str(item.value)) for item in cls]
-
-
+    CREDITO = 'CREDITO', _("Crédito")
+    DEBITO = 'DEBITO', _("Débito")
+    AJUSTE_POSITIVO = 'AJUSTE_POSITIVO', _("Ajuste Positivo")
+    AJUSTE_NEGATIVO = 'AJUSTE_NEGATIVO', _("Ajuste Negativo")
+    TRANSFERENCIA_INTERNA = 'TRANSFERENCIA_INTERNA', _("Transferencia Interna")
+    BLOQUEO = 'BLOQUEO', _("Bloqueo de Fondos")
+    DESBLOQUEO = 'DESBLOQUEO', _("Desbloqueo de Fondos")
+    REEMBOLSO = 'REEMBOLSO', _("Reembolso")
+    RETIRO = 'RETIRO', _("Retiro")
+    COMPRA_EXTERNA = 'COMPRA_EXTERNA', _("Compra Externa (MercadoPago)")
+    CARGO_EXTERNO = 'CARGO_EXTERNO', _("Cargo Externo (API, Addinteli)")
+    BONO_PROMOCIONAL = 'BONO_PROMOCIONAL', _("Bono Promocional")
+    AJUSTE_MANUAL = 'AJUSTE_MANUAL', _("Ajuste Manual Admin")
+    CONCILIACION_BANCARIA = 'CONCILIACION_BANCARIA', _("Conciliación Bancaria")
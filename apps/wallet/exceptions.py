@@ -13,8 +13,9 @@ class WalletException(Exception):
     Sirve como raíz para excepciones específicas, permitiendo captura genérica en servicios.
     """
     def __init__(self, mensaje=_("Error en la operación de la billetera.")):
+        # El mensaje puede ser un texto diferido: se traduce cuando se muestra (str(exc)), no al lanzarse.
         self.mensaje = mensaje
-        super().__init__(str(mensaje))
+        super().__init__(mensaje)
 
 class SaldoInsuficienteException(WalletException):
     """
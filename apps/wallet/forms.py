@@ -12,69 +12,163 @@ Optimizaciones aplicadas:
 - Compatibilidad garantizada con servicios y modelos existentes.
 """
 
+import hashlib
 import logging
 from django import forms
-from django.utils.translation import gettext_lazy as _
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils.translation import get_language, gettext_lazy as _
 from decimal import Decimal
 from django.core.exceptions import ValidationError
 from apps.users.models import User, ROLE_ADMIN, ROLE_DISTRIBUIDOR, ROLE_VENDEDOR, ROLE_CLIENTE
 from apps.wallet.services import WalletService
-from apps.vendedores.models import DistribuidorVendedor
 
 # Configuración avanzada de logging para auditoría empresarial
 logger = logging.getLogger(__name__)
 
-class AdminRecargaForm(forms.Form):
+# Límites de monto (MXN), construidos una sola vez al importar el módulo
+_MIN_AMOUNT = Decimal('0.01')
+_MAX_RECARGA = Decimal('1000000.00')
+_MAX_BLOQUEO = WalletService.LIMITE_BLOQUEO
+_UNKNOWN = 'unknown'
+
+# Roles que pueden transferir y destinos permitidos para cada uno
+_TRANSFER_ROLES = frozenset({ROLE_ADMIN, ROLE_DISTRIBUIDOR})
+_DISTRIB_DESTINO_ROLES = frozenset({ROLE_VENDEDOR, ROLE_CLIENTE})
+_ADMIN_DESTINO_ROLES = frozenset({ROLE_DISTRIBUIDOR, ROLE_VENDEDOR, ROLE_CLIENTE})
+
+# Vigencia (segundos) de las opciones cacheadas de los selectores de usuario
+USER_CHOICES_CACHE_TIMEOUT = 60
+
+# Clases CSS compartidas por los widgets de los formularios
+_INPUT_CLASS = 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500'
+
+# Columnas que necesitan los selectores de usuario: str(user) y las validaciones sobre su wallet
+_CAMPOS_USUARIO = (
+    'id', 'username', 'rol', 'first_name', 'last_name',
+    'wallet__id', 'wallet__balance', 'wallet__hierarchy_root',
+)
+
+
+def _active_users_qs():
     """
-    Formulario para Admins que permite recargar saldo en cualquier billetera.
-    Valida entradas básicas y delega operaciones financieras a WalletService con auditoría integral.
+    Usuarios activos con su wallet, para los selectores de usuario de los formularios.
+    Se construye en cada __init__ en lugar de clonar un queryset declarado en la clase.
+    """
+    return User.objects.filter(deleted_at__isnull=True).select_related('wallet').only(*_CAMPOS_USUARIO).order_by('first_name', 'last_name')
 
-    Attributes:
-        usuario: Usuario cuya billetera será recargada (optimizado con prefetch).
-        monto: Monto a acreditar (MXN) con validación estricta.
-        referencia: Referencia externa opcional (e.g., MercadoPago ID) con sanitización.
+
+class _CachedUserIterator(forms.models.ModelChoiceIterator):
     """
-    usuario = forms.ModelChoiceField(
-        queryset=User.objects.filter(deleted_at__isnull=True).select_related('wallet').prefetch_related('wallet__movements'),
-        label=_("Usuario destino"),
-        help_text=_("Seleccione el usuario cuya billetera será recargada."),
+    Itera las opciones (pk, etiqueta) del selector desde la caché, indexadas por el SQL del
+    queryset y el idioma activo. Solo se cachea lo que se pinta: al validar, el campo sigue
+    resolviendo el pk seleccionado contra la base de datos.
+    """
+
+    def _cache_key(self):
+        sql, params = self.queryset.query.sql_with_params()
+        digest = hashlib.sha256(f'{sql}|{params}|{get_language()}'.encode('utf-8')).hexdigest()
+        return f'wallet_form_users_{digest}'
+
+    def _opciones(self):
+        return cache.get_or_set(
+            self._cache_key(),
+            lambda: [(obj.pk, self.field.label_from_instance(obj)) for obj in self.queryset],
+            USER_CHOICES_CACHE_TIMEOUT
+        )
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from self._opciones()
+
+    def __len__(self):
+        return len(self._opciones()) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self._opciones())
+
+
+class _UserChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField de usuarios cuyas opciones renderizadas salen de la caché.
+    """
+    iterator = _CachedUserIterator
+
+
+def _usuario_field(label, help_text):
+    """
+    Selector de usuario; el queryset se asigna en __init__ del formulario.
+    """
+    return _UserChoiceField(
+        queryset=None,
+        label=label,
+        help_text=help_text,
         widget=forms.Select(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
+            'class': _INPUT_CLASS,
             'aria-describedby': 'usuario_help',
             'data-autocomplete': 'off',  # Mejora de seguridad contra ataques
+            'required': 'required',
         })
     )
-    monto = forms.DecimalField(
+
+
+def _monto_field(max_value, label, help_text, placeholder):
+    """
+    Monto en MXN con dos decimales entre _MIN_AMOUNT y `max_value`.
+    """
+    return forms.DecimalField(
         max_digits=12,
         decimal_places=2,
-        min_value=Decimal('0.01'),
-        max_value=Decimal('1000000.00'),
-        label=_("Monto a recargar"),
-        help_text=_("Monto en MXN a acreditar en la billetera (máximo 1,000,000 MXN)."),
+        min_value=_MIN_AMOUNT,
+        max_value=max_value,
+        label=label,
+        help_text=help_text,
         widget=forms.NumberInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: 1000.00"),
+            'class': _INPUT_CLASS,
+            'placeholder': placeholder,
             'step': '0.01',
             'aria-describedby': 'monto_help',
             'required': 'required',  # Mejora de UX
         })
     )
-    referencia = forms.CharField(
+
+
+def _referencia_field(help_text, placeholder):
+    """
+    Referencia externa opcional.
+    """
+    return forms.CharField(
         max_length=255,
         required=False,
         label=_("Referencia externa (opcional)"),
-        help_text=_("Identificador externo, e.g., ID de transacción MercadoPago."),
+        help_text=help_text,
         widget=forms.TextInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: MP-1234567890"),
+            'class': _INPUT_CLASS,
+            'placeholder': placeholder,
             'aria-describedby': 'referencia_help',
             'autocomplete': 'off',  # Prevención de autocompletado no deseado
         })
     )
 
+
+class _WalletOpForm(forms.Form):
+    """
+    Base de los formularios que operan sobre la billetera de un usuario elegido (recarga,
+    bloqueo y desbloqueo). Las subclases declaran `usuario`, `monto` y `referencia` con
+    los helpers del módulo y fijan `service_method`, la operación de WalletService a ejecutar.
+    """
+    service_method = None
+    # Los widgets obligatorios ya declaran 'required' en sus attrs
+    use_required_attribute = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['usuario'].queryset = _active_users_qs()
+
     def clean(self):
         """
-        Valida la integridad de los datos de entrada con protección contra inyecciones y errores.
+        Valida que el usuario seleccionado tenga billetera; montos y referencia ya los valida cada campo.
 
         Returns:
             dict: Datos validados y sanitizados.
@@ -84,21 +178,15 @@ class AdminRecargaForm(forms.Form):
         """
         cleaned_data = super().clean()
         usuario = cleaned_data.get('usuario')
-        monto = cleaned_data.get('monto')
-        referencia = cleaned_data.get('referencia', '').strip()  # Sanitización
 
-        if usuario and not hasattr(usuario, 'wallet'):
+        if usuario and getattr(usuario, 'wallet', None) is None:
             self.add_error('usuario', _("El usuario seleccionado no tiene una billetera asociada."))
-        if monto is not None and (monto < Decimal('0.01') or monto > Decimal('1000000.00')):
-            self.add_error('monto', _("El monto debe estar entre 0.01 y 1,000,000 MXN."))
-        if referencia and not referencia.strip():
-            self.add_error('referencia', _("La referencia no puede estar vacía si se proporciona."))
 
         return cleaned_data
 
     def save(self, creado_por, actor_ip=None, device_info=None):
         """
-        Ejecuta la recarga utilizando WalletService con manejo de excepciones mejorado.
+        Ejecuta la operación de la subclase utilizando WalletService.
 
         Args:
             creado_por: Usuario que realiza la operación (obligatorio).
@@ -112,18 +200,47 @@ class AdminRecargaForm(forms.Form):
             WalletException: Si la operación falla (manejado por WalletService).
             ValueError: Si el usuario creador no es válido.
         """
-        if not creado_por or not hasattr(creado_por, 'is_authenticated') or not creado_por.is_authenticated:
+        if creado_por is None or getattr(creado_por, 'is_anonymous', True):
             raise ValueError(_("El usuario creador debe estar autenticado."))
 
-        return WalletService.deposit(
-            wallet=self.cleaned_data['usuario'].wallet,
-            amount=self.cleaned_data['monto'],
+        cd = self.cleaned_data
+        return self.service_method(
+            wallet=cd['usuario'].wallet,
+            amount=cd['monto'],
             creado_por=creado_por,
-            referencia=self.cleaned_data.get('referencia'),
-            actor_ip=actor_ip or 'unknown',
-            device_info=device_info or 'unknown'
+            referencia=cd.get('referencia'),
+            actor_ip=actor_ip or _UNKNOWN,
+            device_info=device_info or _UNKNOWN
         )
 
+
+class AdminRecargaForm(_WalletOpForm):
+    """
+    Formulario para Admins que permite recargar saldo en cualquier billetera.
+    Valida entradas básicas y delega operaciones financieras a WalletService con auditoría integral.
+
+    Attributes:
+        usuario: Usuario cuya billetera será recargada (con select_related de su wallet).
+        monto: Monto a acreditar (MXN) con validación estricta.
+        referencia: Referencia externa opcional (e.g., MercadoPago ID) con sanitización.
+    """
+    usuario = _usuario_field(
+        _("Usuario destino"),
+        _("Seleccione el usuario cuya billetera será recargada."),
+    )
+    monto = _monto_field(
+        _MAX_RECARGA,
+        _("Monto a recargar"),
+        _("Monto en MXN a acreditar en la billetera (máximo 1,000,000 MXN)."),
+        _("Ejemplo: 1000.00"),
+    )
+    referencia = _referencia_field(
+        _("Identificador externo, e.g., ID de transacción MercadoPago."),
+        _("Ejemplo: MP-1234567890"),
+    )
+    service_method = staticmethod(WalletService.deposit)
+
+
 class TransferenciaForm(forms.Form):
     """
     Formulario para transferencias internas entre billeteras, respetando jerarquías de roles.
@@ -131,46 +248,33 @@ class TransferenciaForm(forms.Form):
     El usuario origen es siempre el usuario autenticado con validación jerárquica optimizada.
 
     Attributes:
-        destino: Usuario que recibe los fondos (filtrado por jerarquía con prefetch).
+        destino: Usuario que recibe los fondos (filtrado por jerarquía).
         monto: Monto a transferir (MXN) con límites estrictos.
         referencia: Referencia externa opcional (e.g., operación interna) con sanitización.
     """
-    destino = forms.ModelChoiceField(
-        queryset=User.objects.none(),
+    # Los widgets obligatorios ya declaran 'required' en sus attrs
+    use_required_attribute = False
+
+    destino = _UserChoiceField(
+        queryset=None,  # Se asigna en __init__
         label=_("Usuario destino"),
         help_text=_("Seleccione el usuario que recibirá los fondos."),
         widget=forms.Select(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
+            'class': _INPUT_CLASS,
             'aria-describedby': 'destino_help',
             'data-autocomplete': 'off',  # Mejora de seguridad
-        })
-    )
-    monto = forms.DecimalField(
-        max_digits=12,
-        decimal_places=2,
-        min_value=Decimal('0.01'),
-        max_value=Decimal('1000000.00'),
-        label=_("Monto a transferir"),
-        help_text=_("Monto en MXN a transferir a la billetera del destinatario (máximo 1,000,000 MXN)."),
-        widget=forms.NumberInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: 500.00"),
-            'step': '0.01',
-            'aria-describedby': 'monto_help',
             'required': 'required',
         })
     )
-    referencia = forms.CharField(
-        max_length=255,
-        required=False,
-        label=_("Referencia externa (opcional)"),
-        help_text=_("Identificador externo, e.g., ID de operación interna."),
-        widget=forms.TextInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: TX-987654321"),
-            'aria-describedby': 'referencia_help',
-            'autocomplete': 'off',
-        })
+    monto = _monto_field(
+        _MAX_RECARGA,
+        _("Monto a transferir"),
+        _("Monto en MXN a transferir a la billetera del destinatario (máximo 1,000,000 MXN)."),
+        _("Ejemplo: 500.00"),
+    )
+    referencia = _referencia_field(
+        _("Identificador externo, e.g., ID de operación interna."),
+        _("Ejemplo: TX-987654321"),
     )
 
     def __init__(self, *args, user=None, **kwargs):
@@ -184,9 +288,9 @@ class TransferenciaForm(forms.Form):
         Raises:
             ValueError: Si no se proporciona un usuario autenticado o el rol no es válido.
         """
-        if not user or not hasattr(user, 'is_authenticated') or not user.is_authenticated:
+        if user is None or getattr(user, 'is_anonymous', True):
             raise ValueError(_("Se requiere un usuario autenticado para inicializar el formulario."))
-        if user.rol not in [ROLE_ADMIN, ROLE_DISTRIBUIDOR]:
+        if user.rol not in _TRANSFER_ROLES:
             raise ValueError(_("Solo Admins y Distribuidores pueden realizar transferencias."))
         super().__init__(*args, **kwargs)
         self.user = user
@@ -195,28 +299,36 @@ class TransferenciaForm(forms.Form):
     def _init_destino_queryset(self):
         """
         Configura el queryset de destinos válidos según la jerarquía del usuario origen.
-        Optimizado con prefetch_related y filtrado seguro.
+        Parte de _active_users_qs() y solo cambia el filtro de jerarquía según el rol.
 
         Notes:
-            - Usa select_related y prefetch_related para rendimiento.
-            - Filtra por hierarchy_root para jerarquías multinivel.
+            - Usa select_related para leer la wallet en la misma consulta.
+            - Filtra por hierarchy_root (del usuario y de su wallet) para jerarquías multinivel,
+              de modo que clean() no necesita revalidar la jerarquía.
             - Ordena alfabéticamente por nombre completo.
         """
+        destino = self.fields['destino']
         if self.user.rol == ROLE_DISTRIBUIDOR:
-            self.fields['destino'].queryset = User.objects.filter(
-                deleted_at__isnull=True,
-                rol__in=[ROLE_VENDEDOR, ROLE_CLIENTE],
-                hierarchy_root=self.user
-            ).select_related('wallet').prefetch_related('wallet__movements').order_by('first_name', 'last_name')
-        elif self.user.rol == ROLE_ADMIN:
-            self.fields['destino'].queryset = User.objects.filter(
-                deleted_at__isnull=True,
-                rol__in=[ROLE_DISTRIBUIDOR, ROLE_VENDEDOR, ROLE_CLIENTE]
-            ).select_related('wallet').prefetch_related('wallet__movements').order_by('first_name', 'last_name')
+            # Solo subordinados con relación vigente y wallet dentro de su red
+            jerarquia = Q(
+                rol__in=_DISTRIB_DESTINO_ROLES,
+                hierarchy_root=self.user,
+                perfil_distribuidor__distribuidor=self.user,
+                wallet__hierarchy_root=self.user,
+            )
+            destino.error_messages['invalid_choice'] = _("El usuario destino no pertenece a su red de distribución.")
+        else:
+            # ROLE_ADMIN (validado en __init__): puede transferir a cualquier nivel inferior
+            jerarquia = Q(rol__in=_ADMIN_DESTINO_ROLES) & (
+                Q(wallet__hierarchy_root__isnull=True) | Q(wallet__hierarchy_root=self.user)
+            )
+            destino.error_messages['invalid_choice'] = _("El usuario destino no pertenece a una jerarquía válida.")
+        destino.queryset = _active_users_qs().filter(jerarquia)
 
     def clean(self):
         """
-        Valida la integridad de los datos de entrada con lógica jerárquica optimizada.
+        Valida la integridad de los datos de entrada. La jerarquía ya la garantiza el queryset
+        de destino: un usuario fuera de él no pasa la validación del campo.
 
         Returns:
             dict: Datos validados y sanitizados.
@@ -228,48 +340,29 @@ class TransferenciaForm(forms.Form):
         destino = cleaned_data.get('destino')
         monto = cleaned_data.get('monto')
         referencia = cleaned_data.get('referencia', '').strip()
+        # El descriptor inverso consulta una sola vez y deja la wallet (o su ausencia) en caché
+        origen_wallet = getattr(self.user, 'wallet', None)
+        destino_wallet = getattr(destino, 'wallet', None) if destino else None
 
         # Validaciones básicas
-        if not hasattr(self.user, 'wallet'):
+        if origen_wallet is None:
             self.add_error(None, _("El usuario origen no tiene una billetera asociada."))
-        if destino and not hasattr(destino, 'wallet'):
+        if destino and destino_wallet is None:
             self.add_error('destino', _("El usuario destino no tiene una billetera asociada."))
         if destino and destino == self.user:
             self.add_error('destino', _("No se puede transferir a la misma billetera."))
-        if monto is not None and hasattr(self.user, 'wallet') and monto > self.user.wallet.balance:
+        # Prevalidación para mostrar el error en el formulario; la verificación definitiva la hace
+        # WalletService.transfer con la fila de la wallet bloqueada (select_for_update)
+        if monto is not None and origen_wallet is not None and monto > origen_wallet.balance:
             self.add_error('monto', _("Saldo insuficiente para completar la transferencia."))
         cleaned_data['referencia'] = referencia or None
 
-        # Validación jerárquica mejorada
-        if destino and hasattr(destino, 'wallet') and hasattr(self.user, 'wallet'):
-            try:
-                if self.user.rol == ROLE_DISTRIBUIDOR:
-                    relacion = DistribuidorVendedor.objects.get(distribuidor=self.user, vendedor=destino)
-                    if destino.wallet.hierarchy_root != self.user:
-                        logger.warning(
-                            f"Intento de transferencia a usuario no subordinado: "
-                            f"Origen {self.user.username} (ID: {self.user.id}, Wallet Hierarchy Root: {self.user.wallet.hierarchy_root_id}), "
-                            f"Destino {destino.username} (ID: {destino.id}, Wallet Hierarchy Root: {destino.wallet.hierarchy_root_id}) "
-                            f"- Relación encontrada: {relacion.uuid}"
-                        )
-                        self.add_error('destino', _("El usuario destino no pertenece a su red de distribución."))
-                elif self.user.rol == ROLE_ADMIN:
-                    # Admins pueden transferir a cualquier nivel inferior
-                    if destino.wallet.hierarchy_root not in [None, self.user]:
-                        logger.warning(
-                            f"Intento de transferencia a usuario no subordinado: "
-                            f"Origen {self.user.username} (ID: {self.user.id}), "
-                            f"Destino {destino.username} (ID: {destino.id}, Wallet Hierarchy Root: {destino.wallet.hierarchy_root_id})"
-                        )
-                        self.add_error('destino', _("El usuario destino no pertenece a una jerarquía válida."))
-            except DistribuidorVendedor.DoesNotExist:
-                logger.warning(
-                    f"Intento de transferencia a usuario no subordinado: "
-                    f"Origen {self.user.username} (ID: {self.user.id}, Wallet Hierarchy Root: {self.user.wallet.hierarchy_root_id}), "
-                    f"Destino {destino.username} (ID: {destino.id}, Wallet Hierarchy Root: {destino.wallet.hierarchy_root_id}) "
-                    f"- Sin relación encontrada"
-                )
-                self.add_error('destino', _("El usuario destino no pertenece a su red de distribución."))
+        if self.has_error('destino', 'invalid_choice'):
+            # El queryset de destino ya descartó al usuario; solo queda dejar rastro del intento
+            logger.warning(
+                "Intento de transferencia a usuario no subordinado: Origen %s (ID: %s), Destino ID: %s",
+                self.user.username, self.user.id, self.data.get(self.add_prefix('destino')),
+            )
 
         return cleaned_data
 
@@ -293,215 +386,70 @@ class TransferenciaForm(forms.Form):
             - Compatible con auditorías PCI-DSS, SOC2 e ISO 27001.
             - Optimizado para transacciones multinivel con trazabilidad completa.
         """
-        if not creado_por or not hasattr(creado_por, 'is_authenticated') or not creado_por.is_authenticated:
+        if creado_por is None or getattr(creado_por, 'is_anonymous', True):
             raise ValueError(_("El usuario creador debe estar autenticado."))
 
+        cd = self.cleaned_data
         return WalletService.transfer(
             origen_wallet=self.user.wallet,
-            destino_wallet=self.cleaned_data['destino'].wallet,
-            amount=self.cleaned_data['monto'],
+            destino_wallet=cd['destino'].wallet,
+            amount=cd['monto'],
             creado_por=creado_por,
-            referencia=self.cleaned_data['referencia'],
-            actor_ip=actor_ip or 'unknown',
-            device_info=device_info or 'unknown'
+            referencia=cd['referencia'],
+            actor_ip=actor_ip or _UNKNOWN,
+            device_info=device_info or _UNKNOWN
         )
 
-class BloqueoFondosForm(forms.Form):
+
+class BloqueoFondosForm(_WalletOpForm):
     """
     Formulario para bloquear fondos en una billetera, usado por Admins financieros.
     Soporta retenciones preventivas, auditorías o cumplimiento regulatorio con validación estricta.
 
     Attributes:
-        usuario: Usuario cuya billetera será bloqueada (optimizado con prefetch).
+        usuario: Usuario cuya billetera será bloqueada (con select_related de su wallet).
         monto: Monto a retener (MXN) con límites antifraude.
         referencia: Referencia externa opcional (e.g., auditoría ID) con sanitización.
     """
-    usuario = forms.ModelChoiceField(
-        queryset=User.objects.filter(deleted_at__isnull=True).select_related('wallet').prefetch_related('wallet__movements'),
-        label=_("Usuario a bloquear"),
-        help_text=_("Seleccione el usuario cuya billetera será bloqueada."),
-        widget=forms.Select(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'aria-describedby': 'usuario_help',
-            'data-autocomplete': 'off',
-        })
+    usuario = _usuario_field(
+        _("Usuario a bloquear"),
+        _("Seleccione el usuario cuya billetera será bloqueada."),
     )
-    monto = forms.DecimalField(
-        max_digits=12,
-        decimal_places=2,
-        min_value=Decimal('0.01'),
-        max_value=Decimal('50000.00'),  # Alineado con LIMITE_BLOQUEO
-        label=_("Monto a bloquear"),
-        help_text=_("Monto en MXN a retener en la billetera (máximo 50,000 MXN por límite antifraude)."),
-        widget=forms.NumberInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: 2000.00"),
-            'step': '0.01',
-            'aria-describedby': 'monto_help',
-            'required': 'required',
-        })
+    monto = _monto_field(
+        _MAX_BLOQUEO,
+        _("Monto a bloquear"),
+        _("Monto en MXN a retener en la billetera (máximo 50,000 MXN por límite antifraude)."),
+        _("Ejemplo: 2000.00"),
     )
-    referencia = forms.CharField(
-        max_length=255,
-        required=False,
-        label=_("Referencia externa (opcional)"),
-        help_text=_("Identificador externo, e.g., ID de auditoría."),
-        widget=forms.TextInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: AUDIT-2025-001"),
-            'aria-describedby': 'referencia_help',
-            'autocomplete': 'off',
-        })
+    referencia = _referencia_field(
+        _("Identificador externo, e.g., ID de auditoría."),
+        _("Ejemplo: AUDIT-2025-001"),
     )
+    service_method = staticmethod(WalletService.block_funds)
 
-    def clean(self):
-        """
-        Valida la integridad de los datos de entrada con protección antifraude.
-
-        Returns:
-            dict: Datos validados y sanitizados.
 
-        Raises:
-            forms.ValidationError: Si los datos no cumplen con las reglas de negocio.
-        """
-        cleaned_data = super().clean()
-        usuario = cleaned_data.get('usuario')
-        monto = cleaned_data.get('monto')
-        referencia = cleaned_data.get('referencia', '').strip()
-
-        if usuario and not hasattr(usuario, 'wallet'):
-            self.add_error('usuario', _("El usuario seleccionado no tiene una billetera asociada."))
-        if monto is not None and (monto < Decimal('0.01') or monto > Decimal('50000.00')):
-            self.add_error('monto', _("El monto debe estar entre 0.01 y 50,000 MXN por límites antifraude."))
-        if referencia and not referencia.strip():
-            self.add_error('referencia', _("La referencia no puede estar vacía si se proporciona."))
-
-        return cleaned_data
-
-    def save(self, creado_por, actor_ip=None, device_info=None):
-        """
-        Ejecuta el bloqueo de fondos utilizando WalletService con manejo robusto.
-
-        Args:
-            creado_por: Usuario que realiza la operación (obligatorio).
-            actor_ip: Dirección IP del cliente (opcional, predeterminado a 'unknown').
-            device_info: Información del dispositivo (opcional, predeterminado a 'unknown').
-
-        Returns:
-            WalletMovement: Movimiento financiero creado con auditoría.
-
-        Raises:
-            WalletException: Si la operación falla (manejado por WalletService).
-            ValueError: Si el usuario creador no es válido.
-        """
-        if not creado_por or not hasattr(creado_por, 'is_authenticated') or not creado_por.is_authenticated:
-            raise ValueError(_("El usuario creador debe estar autenticado."))
-
-        return WalletService.block_funds(
-            wallet=self.cleaned_data['usuario'].wallet,
-            amount=self.cleaned_data['monto'],
-            creado_por=creado_por,
-            referencia=self.cleaned_data.get('referencia'),
-            actor_ip=actor_ip or 'unknown',
-            device_info=device_info or 'unknown'
-        )
-
-class DesbloqueoFondosForm(forms.Form):
+class DesbloqueoFondosForm(_WalletOpForm):
     """
     Formulario para desbloquear fondos retenidos en una billetera, usado por Admins financieros.
     Soporta liberación de fondos con validación estricta y auditoría.
 
     Attributes:
-        usuario: Usuario cuya billetera será desbloqueada (optimizado con prefetch).
+        usuario: Usuario cuya billetera será desbloqueada (con select_related de su wallet).
         monto: Monto a liberar (MXN) con límites antifraude.
         referencia: Referencia externa opcional (e.g., resolución de auditoría) con sanitización.
     """
-    usuario = forms.ModelChoiceField(
-        queryset=User.objects.filter(deleted_at__isnull=True).select_related('wallet').prefetch_related('wallet__movements'),
-        label=_("Usuario a desbloquear"),
-        help_text=_("Seleccione el usuario cuya billetera será desbloqueada."),
-        widget=forms.Select(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'aria-describedby': 'usuario_help',
-            'data-autocomplete': 'off',
-        })
+    usuario = _usuario_field(
+        _("Usuario a desbloquear"),
+        _("Seleccione el usuario cuya billetera será desbloqueada."),
     )
-    monto = forms.DecimalField(
-        max_digits=12,
-        decimal_places=2,
-        min_value=Decimal('0.01'),
-        max_value=Decimal('50000.00'),  # Alineado con LIMITE_BLOQUEO
-        label=_("Monto a desbloquear"),
-        help_text=_("Monto en MXN a liberar de la billetera (máximo 50,000 MXN por límite antifraude)."),
-        widget=forms.NumberInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: 2000.00"),
-            'step': '0.01',
-            'aria-describedby': 'monto_help',
-            'required': 'required',
-        })
+    monto = _monto_field(
+        _MAX_BLOQUEO,
+        _("Monto a desbloquear"),
+        _("Monto en MXN a liberar de la billetera (máximo 50,000 MXN por límite antifraude)."),
+        _("Ejemplo: 2000.00"),
     )
-    referencia = forms.CharField(
-        max_length=255,
-        required=False,
-        label=_("Referencia externa (opcional)"),
-        help_text=_("Identificador externo, e.g., ID de resolución de auditoría."),
-        widget=forms.TextInput(attrs={
-            'class': 'form-control w-full px-4 py-2 border rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500',
-            'placeholder': _("Ejemplo: AUDIT-2025-002"),
-            'aria-describedby': 'referencia_help',
-            'autocomplete': 'off',
-        })
+    referencia = _referencia_field(
+        _("Identificador externo, e.g., ID de resolución de auditoría."),
+        _("Ejemplo: AUDIT-2025-002"),
     )
-
-    def clean(self):
-        """
-        Valida la integridad de los datos de entrada con protección antifraude.
-
-        Returns:
-            dict: Datos validados y sanitizados.
-
-        Raises:
-            forms.ValidationError: Si los datos no cumplen con las reglas de negocio.
-        """
-        cleaned_data = super().clean()
-        usuario = cleaned_data.get('usuario')
-        monto = cleaned_data.get('monto')
-        referencia = cleaned_data.get('referencia', '').strip()
-
-        if usuario and not hasattr(usuario, 'wallet'):
-            self.add_error('usuario', _("El usuario seleccionado no tiene una billetera asociada."))
-        if monto is not None and (monto < Decimal('0.01') or monto > Decimal('50000.00')):
-            self.add_error('monto', _("El monto debe estar entre 0.01 y 50,000 MXN por límites antifraude."))
-        if referencia and not referencia.strip():
-            self.add_error('referencia', _("La referencia no puede estar vacía si se proporciona."))
-
-        return cleaned_data
-
-    def save(self, creado_por, actor_ip=None, device_info=None):
-        """
-        Ejecuta el desbloqueo de fondos utilizando WalletService con manejo robusto.
-
-        Args:
-            creado_por: Usuario que realiza la operación (obligatorio).
-            actor_ip: Dirección IP del cliente (opcional, predeterminado a 'unknown').
-            device_info: Información del dispositivo (opcional, predeterminado a 'unknown').
-
-        Returns:
-            WalletMovement: Movimiento financiero creado con auditoría.
-
-        Raises:
-            WalletException: Si la operación falla (manejado por WalletService).
-            ValueError: Si el usuario creador no es válido.
-        """
-        if not creado_por or not hasattr(creado_por, 'is_authenticated') or not creado_por.is_authenticated:
-            raise ValueError(_("El usuario creador debe estar autenticado."))
-
-        return WalletService.unblock_funds(
-            wallet=self.cleaned_data['usuario'].wallet,
-            amount=self.cleaned_data['monto'],
-            creado_por=creado_por,
-            referencia=self.cleaned_data.get('referencia'),
-            actor_ip=actor_ip or 'unknown',
-            device_info=device_info or 'unknown'
-        )
\ No newline at end of file
+    service_method = staticmethod(WalletService.unblock_funds)
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.7 on 2026-10-17 00:19
+
+from django.db import migrations, models
+
+
+def copiar_usuario(apps, schema_editor):
+    Wallet = apps.get_model('wallet', 'Wallet')
+    pendientes = []
+    for wallet in Wallet.objects.select_related('user').only('user__username', 'user__rol').iterator(chunk_size=1000):
+        wallet.user_username = wallet.user.username
+        wallet.user_rol = wallet.user.rol
+        pendientes.append(wallet)
+    Wallet.objects.bulk_update(pendientes, ['user_username', 'user_rol'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallet', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='wallet',
+            name='user_rol',
+            field=models.CharField(blank=True, choices=[('cliente', 'Cliente Final'), ('vendedor', 'Vendedor'), ('distribuidor', 'Distribuidor'), ('admin', 'Administrador')], editable=False, help_text='Copia de user.rol, sincronizada al guardar la billetera y por señales de User.', max_length=20, verbose_name='Rol'),
+        ),
+        migrations.AddField(
+            model_name='wallet',
+            name='user_username',
+            field=models.CharField(blank=True, editable=False, help_text='Copia de user.username, sincronizada al guardar la billetera y por señales de User.', max_length=30, verbose_name='Nombre de usuario'),
+        ),
+        migrations.RunPython(copiar_usuario, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-17 00:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallet', '0002_usuario_listado'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='wallet',
+            index=models.Index(fields=['-last_updated'], name='wallet_last_updated_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='walletmovement',
+            index=models.Index(fields=['-fecha'], name='walletmov_fecha_desc_idx'),
+        ),
+    ]
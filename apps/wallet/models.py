@@ -14,7 +14,7 @@ from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator, RegexValidator
 from django.conf import settings
-from apps.users.models import ROLE_ADMIN, ROLE_DISTRIBUIDOR, ROLE_VENDEDOR, ROLE_CLIENTE
+from apps.users.models import ROLE_ADMIN, ROLE_DISTRIBUIDOR, ROLE_VENDEDOR, ROLE_CLIENTE, ROLE_CHOICES
 from apps.wallet.enums import TipoMovimiento
 
 # Referencia al modelo de usuario personalizado
@@ -36,6 +36,7 @@ class Wallet(models.Model):
         blocked_balance: Fondos retenidos (disputas, auditorías, fraudes).
         hierarchy_root: Admin o Distribuidor padre en la jerarquía.
         last_updated: Fecha y hora de la última modificación.
+        user_username, user_rol: Copia del username y rol del usuario para listados sin JOIN.
     """
     user = models.OneToOneField(
         User,
@@ -74,6 +75,21 @@ class Wallet(models.Model):
         verbose_name=_("Última actualización"),
         help_text=_("Fecha y hora de la última modificación del saldo.")
     )
+    user_username = models.CharField(
+        max_length=30,
+        blank=True,
+        editable=False,
+        verbose_name=_("Nombre de usuario"),
+        help_text=_("Copia de user.username, sincronizada al guardar la billetera y por señales de User.")
+    )
+    user_rol = models.CharField(
+        max_length=20,
+        choices=ROLE_CHOICES,
+        blank=True,
+        editable=False,
+        verbose_name=_("Rol"),
+        help_text=_("Copia de user.rol, sincronizada al guardar la billetera y por señales de User.")
+    )
 
     class Meta:
         verbose_name = _("Billetera")
@@ -83,6 +99,8 @@ class Wallet(models.Model):
             models.Index(fields=['hierarchy_root']),
             models.Index(fields=['balance']),
             models.Index(fields=['blocked_balance']),
+            # Listado del admin ordenado por -last_updated
+            models.Index(fields=['-last_updated'], name='wallet_last_updated_desc_idx'),
         ]
         constraints = [
             models.CheckConstraint(
@@ -98,7 +116,7 @@ class Wallet(models.Model):
         ]
 
     def __str__(self):
-        return f"Wallet [{self.user.username}] ({self.user.rol}) - Balance: {self.balance} MXN"
+        return f"Wallet [{self.user_username}] ({self.user_rol}) - Balance: {self.balance} MXN"
 
     def clean(self):
         """
@@ -174,6 +192,8 @@ class Wallet(models.Model):
             self.full_clean()
             is_new = self.pk is None
             changes = {}
+            self.user_username = self.user.username
+            self.user_rol = self.user.rol
 
             if not is_new:
                 old_instance = Wallet.objects.select_for_update().get(pk=self.pk)
@@ -274,7 +294,7 @@ class WalletMovement(models.Model):
     )
     tipo = models.CharField(
         max_length=50,
-        choices=TipoMovimiento.choices(),
+        choices=TipoMovimiento.choices,
         verbose_name=_("Tipo de movimiento"),
         help_text=_("Tipo de movimiento (crédito, débito, transferencia, etc.).")
     )
@@ -368,6 +388,8 @@ class WalletMovement(models.Model):
             models.Index(fields=['fecha_conciliacion']),
             models.Index(fields=['creado_por']),
             models.Index(fields=['origen_wallet']),
+            # Ordering del modelo y del listado del admin (los movimientos por billetera usan wallet+fecha)
+            models.Index(fields=['-fecha'], name='walletmov_fecha_desc_idx'),
         ]
         constraints = [
             models.CheckConstraint(
@@ -394,7 +416,7 @@ class WalletMovement(models.Model):
                 },
                 code='invalid_monto_range'
             )
-        if self.tipo not in TipoMovimiento.values():
+        if self.tipo not in TipoMovimiento.values:
             raise ValidationError(
                 _("Tipo de movimiento inválido: %(tipo)s.") % {'tipo': self.tipo},
                 code='invalid_tipo'
@@ -432,7 +454,7 @@ class WalletMovement(models.Model):
                 _("No se puede transferir a la misma billetera."),
                 code='self_transfer'
             )
-        if self.origen_wallet.hierarchy_root != self.wallet.hierarchy_root:
+        if self.origen_wallet.hierarchy_root_id != self.wallet.hierarchy_root_id:
             raise ValidationError(
                 _("Las transferencias solo son permitidas dentro de la misma jerarquía."),
                 code='invalid_hierarchy_transfer'
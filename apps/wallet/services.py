@@ -160,8 +160,8 @@ class WalletService:
             logger.warning(f"Intento de transferencia a la misma billetera: {origen_wallet.user.username}")
             raise OperacionNoPermitidaException(_("No se puede transferir a la misma billetera."))
         # Permitir null hierarchy_root para Admin, pero validar jerarquía para otros
-        if origen_wallet.hierarchy_root != destino_wallet.hierarchy_root and \
-           (origen_wallet.hierarchy_root is not None or destino_wallet.hierarchy_root is not None):
+        if origen_wallet.hierarchy_root_id != destino_wallet.hierarchy_root_id and \
+           (origen_wallet.hierarchy_root_id is not None or destino_wallet.hierarchy_root_id is not None):
             if origen_wallet.user.rol == ROLE_DISTRIBUIDOR and destino_wallet.user.rol == ROLE_VENDEDOR:
                 if not DistribuidorVendedor.objects.filter(
                     distribuidor=origen_wallet.user,
@@ -0,0 +1,73 @@
+from decimal import Decimal
+
+from django.contrib import admin
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.db import SessionStore
+from django.db import transaction
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import path
+
+from apps.users.models import User, UserChangeLog
+from apps.wallet.models import Wallet
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+]
+
+
+class _Revertir(Exception):
+    pass
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class RecargaAdminAuditoriaTests(TestCase):
+    """
+    El UserChangeLog de recargar_saldo se escribe al confirmar la transacción y no si se revierte.
+    """
+
+    DESCRIPCION = "Recarga de saldo: 100.00 MXN"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            'admin1', 'admin@example.com', 'Passw0rd!!x', first_name='Admin', last_name='Uno'
+        )
+        cls.distribuidor = User.objects.create_user(
+            'dist1', 'dist@example.com', 'Passw0rd!!x', rol='distribuidor',
+            first_name='Dist', last_name='Uno', hierarchy_root=cls.admin
+        )
+
+    def _recargar(self):
+        request = RequestFactory().post('/', {'monto': '100.00', 'referencia': 'R-1'})
+        request.user = self.admin
+        request.session = SessionStore()
+        request._messages = FallbackStorage(request)
+        return admin.site._registry[Wallet].recargar_saldo(
+            request, Wallet.objects.filter(user=self.distribuidor)
+        )
+
+    def _logs(self):
+        return UserChangeLog.objects.filter(user=self.distribuidor, change_description=self.DESCRIPCION)
+
+    def test_log_se_escribe_al_confirmar(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self._recargar()
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(self._logs().exists())
+
+        for callback in callbacks:
+            callback()
+        log = self._logs().get()
+        self.assertEqual(log.changed_by, self.admin)
+        self.assertEqual(log.details['referencia'], 'R-1')
+
+    def test_log_no_se_escribe_si_se_revierte(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self._recargar()
+                    raise _Revertir
+            except _Revertir:
+                pass
+        self.assertFalse(self._logs().exists())
+        self.assertEqual(Wallet.objects.get(user=self.distribuidor).balance, Decimal('0'))
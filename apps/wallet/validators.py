@@ -137,7 +137,7 @@ class WalletValidator:
         Raises:
             LimiteExcedidoException: Si excede el límite diario.
         """
-        if tipo not in TipoMovimiento.values():
+        if tipo not in TipoMovimiento.values:
             logger.warning(f"Tipo de movimiento inválido: {tipo}")
             raise MovimientoInvalidoException(_("Tipo de movimiento inválido: %(tipo)s.") % {'tipo': tipo})
 
@@ -198,10 +198,10 @@ class WalletValidator:
         if origen_wallet == destino_wallet:
             logger.warning(f"Transferencia a la misma billetera: {origen.username}")
             raise OperacionNoPermitidaException(_("No se puede transferir a la misma billetera."))
-        if origen_wallet.hierarchy_root != destino_wallet.hierarchy_root and \
-           (origen_wallet.hierarchy_root is not None or destino_wallet.hierarchy_root is not None):
+        if origen_wallet.hierarchy_root_id != destino_wallet.hierarchy_root_id and \
+           (origen_wallet.hierarchy_root_id is not None or destino_wallet.hierarchy_root_id is not None):
             logger.warning(
-                f"Jerarquías no coinciden: origen {origen_wallet.hierarchy_root}, destino {destino_wallet.hierarchy_root}"
+                f"Jerarquías no coinciden: origen {origen_wallet.hierarchy_root_id}, destino {destino_wallet.hierarchy_root_id}"
             )
             raise OperacionNoPermitidaException(_("Las billeteras no pertenecen a la misma jerarquía."))
 
@@ -462,7 +462,7 @@ class WalletDashboardView(PermissionRequiredMixin, TemplateView):
             fecha_fin = self.request.GET.get('fecha_fin')
             estado = self.request.GET.get('estado')
 
-            if tipo and tipo in TipoMovimiento.values():
+            if tipo and tipo in TipoMovimiento.values:
                 movimientos = movimientos.filter(tipo=tipo)
                 context['filtro_tipo'] = tipo
             if fecha_inicio:
@@ -529,7 +529,7 @@ class WalletDashboardView(PermissionRequiredMixin, TemplateView):
 
             context.update({
                 'movimientos': page_obj,
-                'tipo_movimientos': [(t.name, t.value) for t in TipoMovimiento],
+                'tipo_movimientos': TipoMovimiento.choices,
                 'creditos': stats['total_creditos'],
                 'debitos': stats['total_debitos'],
                 'transferencias': stats['total_transferencias'],
@@ -579,7 +579,7 @@ class ExportMovimientosView(PermissionRequiredMixin, View):
         fecha_fin = request.GET.get('fecha_fin')
         estado = request.GET.get('estado')
 
-        if tipo and tipo in TipoMovimiento.values():
+        if tipo and tipo in TipoMovimiento.values:
             movimientos = movimientos.filter(tipo=tipo)
         if fecha_inicio:
             fecha_inicio_parsed = parse_date(fecha_inicio)
@@ -61,14 +61,21 @@ SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
 X_FRAME_OPTIONS = "DENY"
 CSRF_COOKIE_HTTPONLY = True
 
+# ─────────────── 5. TEMPLATES ───────────────
+# Loader cacheado explícito: cada plantilla (p. ej. los correos de bienvenida de
+# vendedores) se compila una sola vez por proceso. Requiere APP_DIRS=False.
+TEMPLATES[0]["APP_DIRS"] = False                         # noqa: F405
+TEMPLATES[0]["OPTIONS"]["loaders"] = [                   # noqa: F405
+    (
+        "django.template.loaders.cached.Loader",
+        [
+            "django.template.loaders.filesystem.Loader",
+            "django.template.loaders.app_directories.Loader",
+        ],
+    ),
+]
 
-
-
-
-
-
-
-# ─────────────── 5. EMAIL ───────────────
+# ─────────────── 6. EMAIL ───────────────
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = config("EMAIL_HOST", default="smtp.gmail.com")
 EMAIL_PORT = config("EMAIL_PORT", cast=int, default=587)
@@ -82,28 +89,28 @@ SERVER_EMAIL = DEFAULT_FROM_EMAIL
 if not EMAIL_HOST_PASSWORD:
     EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
-# ─────────────── 6. STATIC & MEDIA ───────────────
+# ─────────────── 7. STATIC & MEDIA ───────────────
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"      # noqa: F405
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"            # noqa: F405
 
-# ─────────────── 7. LOGGING ───────────────
+# ─────────────── 8. LOGGING ───────────────
 LOGGING["loggers"]["django"]["level"] = "WARNING"        # noqa: F405
 LOGGING["loggers"]["apps"]["level"] = "INFO"             # noqa: F405
 LOGGING["handlers"]["file"]["filename"] = BASE_DIR / "logs/production.log"  # noqa: F405
 
-# ─────────────── 8. ADMINS ───────────────
+# ─────────────── 9. ADMINS ───────────────
 ADMINS = [
     (config("ADMIN_NAME", default="Administrador"),
      config("ADMIN_EMAIL", default="admin@mexared.com.mx"))
 ]
 MANAGERS = ADMINS
 
-# ─────────────── 9. SESSIONS ───────────────
+# ─────────────── 10. SESSIONS ───────────────
 SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
 
-# ─────────────── 10. VALIDACIÓN FINAL ───────────────
+# ─────────────── 11. VALIDACIÓN FINAL ───────────────
 logger = logging.getLogger(__name__)
 logger.info("✅ Settings de producción cargados correctamente · DEBUG=%s", DEBUG)